@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from app.persistence import log_audit_events, utc_now
+
+logger = logging.getLogger(__name__)
+
+
+class AuditQueue:
+    """Writes audit events from a background thread in batches.
+
+    Handlers call log() and return without waiting on SQLite. Anything that reads
+    audit_events calls flush() first so it sees events logged before it. Until
+    start() is called, or if the writer thread has died, log() writes synchronously.
+    A batch that still fails after ``write_attempts`` tries is logged and dropped.
+    """
+
+    def __init__(self, batch_size: int = 200, write_attempts: int = 3, retry_delay: float = 0.1) -> None:
+        self.batch_size = batch_size
+        self.write_attempts = write_attempts
+        self.retry_delay = retry_delay
+        self._queue: queue.Queue[tuple[Path, dict[str, Any]] | None] = queue.Queue()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            if self._thread.is_alive():
+                self._queue.put(None)
+                self._thread.join()
+            self._thread = None
+            self._drain()
+
+    def flush(self) -> None:
+        if self._thread is None:
+            return
+        # Wait for the writer, but stop waiting if it dies with events still queued
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks and self._thread.is_alive():
+                self._queue.all_tasks_done.wait(0.1)
+        if not self._thread.is_alive():
+            self._drain()
+
+    def log(
+        self,
+        db_path: Path,
+        event_type: str,
+        action: str,
+        entity_type: str | None = None,
+        entity_id: str | None = None,
+        actor: str = "system",
+        detail: str | None = None,
+        old_value: str | None = None,
+        new_value: str | None = None,
+    ) -> None:
+        """Same arguments as persistence.log_audit_event; the timestamp is taken now."""
+        event = {
+            "timestamp": utc_now(),
+            "event_type": event_type,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "actor": actor,
+            "action": action,
+            "detail": detail,
+            "old_value": old_value,
+            "new_value": new_value,
+        }
+        if self._thread is None or not self._thread.is_alive():
+            log_audit_events(db_path, [event])
+        else:
+            self._queue.put((db_path, event))
+
+    def _drain(self) -> None:
+        """Write whatever a dead writer left queued, on the calling thread."""
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                if item is not None:
+                    log_audit_events(item[0], [item[1]])
+            finally:
+                self._queue.task_done()
+
+    def _write(self, db_path: Path, events: list[dict[str, Any]]) -> None:
+        for attempt in range(1, self.write_attempts + 1):
+            try:
+                log_audit_events(db_path, events)
+                return
+            except Exception:
+                if attempt == self.write_attempts:
+                    logger.exception("dropping %d audit events for %s", len(events), db_path)
+                    return
+                time.sleep(self.retry_delay * attempt)
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            by_db: dict[Path, list[dict[str, Any]]] = {}
+            for item in batch:
+                if item is None:
+                    stopping = True
+                else:
+                    by_db.setdefault(item[0], []).append(item[1])
+            try:
+                for db_path, events in by_db.items():
+                    self._write(db_path, events)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
@@ -1,22 +1,38 @@
 from __future__ import annotations
 
 import csv
+import hashlib
+import io
+import mmap
+import random
+import re
 import uuid
-from datetime import UTC, datetime
-from collections import Counter
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, date, datetime
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from stat import S_ISREG
+from typing import Any, Callable, Iterable, Iterator
 
-from fastapi import FastAPI, HTTPException
+import orjson
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
-from starlette.responses import FileResponse
+from starlette.responses import FileResponse, Response, StreamingResponse
 from pydantic import BaseModel
 
+from app.audit import AuditQueue
 from app.matching import run_matching
 from app.persistence import (
+    ConnectionPool,
     create_adjustment,
+    create_adjustments,
     delete_split_rule,
     init_db,
     list_adjustments,
@@ -29,20 +45,32 @@ from app.persistence import (
     list_split_rules,
     list_statement_metadata,
     load_policy_overrides,
-    log_audit_event,
     resolve_exception,
+    resolve_exceptions,
     save_match_run,
+    select_latest_run_id,
+    select_line_match,
     upsert_policy_rule,
     upsert_split_rule,
-    upsert_statement_metadata,
+    upsert_split_rules,
+    upsert_statement_metadata_many,
 )
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 DATA_DIR = BASE_DIR / "data"
 DB_PATH = BASE_DIR / "data/demo.db"
 STATIC_DIR = Path(__file__).resolve().parent / "static"
+STATEMENT_LINES_CSV = DATA_DIR / "raw/statements/statement_lines.csv"
+EXPECTED_CSV = DATA_DIR / "expected/ams_expected.csv"
+BANK_FEED_CSV = DATA_DIR / "raw/bank/bank_feed.csv"
+CASE_MANIFEST_CSV = DATA_DIR / "demo_cases/case_manifest.csv"
+
+app = FastAPI(
+    title="Accounting Reconciliation Demo", version="0.2.0", default_response_class=ORJSONResponse,
+)
+audit_log = AuditQueue()
+db_pool = ConnectionPool(DB_PATH)
 
-app = FastAPI(title="Accounting Reconciliation Demo", version="0.2.0")
 
 app.add_middleware(
     CORSMiddleware,
@@ -86,34 +114,59 @@ class CreateAdjustmentRequest(BaseModel):
     period: str | None = None
 
 
+@lru_cache(maxsize=16)
+def _count_rows_cached(path_str: str, mtime_ns: int, size: int) -> int:
+    lines = 0
+    last = b"\n"
+    with open(path_str, "rb") as f:
+        while chunk := f.read(1 << 20):
+            lines += chunk.count(b"\n")
+            last = chunk[-1:]
+    if last != b"\n":
+        lines += 1
+    return max(0, lines - 1)
+
+
 def count_rows(path: Path) -> int:
-    if not path.exists():
-        return 0
-    with path.open(newline="", encoding="utf-8") as f:
-        return max(0, sum(1 for _ in f) - 1)
+    """Data rows in a CSV (lines minus header), cached per file version."""
+    key = _csv_key(path)
+    return _count_rows_cached(*key) if key else 0
 
 
-def read_case_manifest(path: Path) -> list[dict[str, Any]]:
-    if not path.exists():
-        return []
-    with path.open(newline="", encoding="utf-8") as f:
-        return list(csv.DictReader(f))
+def read_case_manifest(path: Path) -> tuple[dict[str, Any], ...]:
+    """Case manifest rows, parsed once per file version; the rows are shared."""
+    return _read_csv(path)
 
 
 def demo_summary() -> dict[str, Any]:
-    statement_path = DATA_DIR / "raw/statements/statement_lines.csv"
-    bank_path = DATA_DIR / "raw/bank/bank_feed.csv"
-    expected_path = DATA_DIR / "expected/ams_expected.csv"
-    cases_path = DATA_DIR / "demo_cases/case_manifest.csv"
+    """Dataset summary, recomputed only when one of its input CSVs changes."""
+    inputs = (STATEMENT_LINES_CSV, BANK_FEED_CSV, EXPECTED_CSV, CASE_MANIFEST_CSV)
+    return _demo_summary_cached(tuple(_csv_key(p) for p in inputs))
 
-    cases = read_case_manifest(cases_path)
-    reasons = Counter(row.get("expected_reason", "unknown") for row in cases)
-    statuses = Counter(row.get("expected_status", "unknown") for row in cases)
 
-    # Clawback stats from statement lines
-    stmt_rows = _read_csv(statement_path)
-    clawback_lines = [r for r in stmt_rows if r.get("txn_type") == "clawback"]
-    clawback_total = sum(float(r.get("gross_commission", 0)) for r in clawback_lines)
+@lru_cache(maxsize=1)
+def _demo_summary_cached(input_keys: tuple[CsvKey | None, ...]) -> dict[str, Any]:
+    statement_path = STATEMENT_LINES_CSV
+    bank_path = BANK_FEED_CSV
+    expected_path = EXPECTED_CSV
+    cases_path = CASE_MANIFEST_CSV
+
+    cases = read_case_manifest(cases_path)
+    reasons: Counter[str] = Counter()
+    statuses: Counter[str] = Counter()
+    for row in cases:
+        reasons[row.get("expected_reason", "unknown")] += 1
+        statuses[row.get("expected_status", "unknown")] += 1
+
+    # Clawback stats from the typed statement columns
+    stmt_key, _, expected_key, _ = input_keys
+    cols = _statement_columns_cached(stmt_key, expected_key)
+    clawback_count = 0
+    clawback_total = 0
+    for txn_type, commission in zip(cols.txn_type, cols.statement):
+        if txn_type == "clawback":
+            clawback_count += 1
+            clawback_total += commission
 
     return {
         "statement_rows": count_rows(statement_path),
@@ -122,42 +175,85 @@ def demo_summary() -> dict[str, Any]:
         "case_rows": len(cases),
         "status_breakdown": dict(statuses),
         "exception_reasons": dict(reasons),
-        "clawback_count": len(clawback_lines),
+        "clawback_count": clawback_count,
         "clawback_total": round(clawback_total, 2),
     }
 
 
 @app.get("/health")
-def health() -> JSONResponse:
-    return JSONResponse({"ok": True, "service": "accounting-demo"})
+def health() -> ORJSONResponse:
+    return ORJSONResponse({"ok": True, "service": "accounting-demo"})
 
 
 @app.get("/api/v1/health")
-def api_health() -> JSONResponse:
-    return JSONResponse({"ok": True})
+def api_health() -> ORJSONResponse:
+    return ORJSONResponse({"ok": True})
+
+
+def _etag_for(*parts: object) -> str:
+    """Weak ETag over the versions a response is derived from (CSV keys, run ids, ...)."""
+    return f'W/"{hashlib.sha1(repr(parts).encode()).hexdigest()}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Whether If-None-Match lists ``etag`` or ``*``, compared weakly (W/ prefixes ignored)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    opaque = etag.removeprefix("W/")
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def _conditional_json(request: Request, etag: str, build: Callable[[], Any]) -> Response:
+    """304 if the client already holds ``etag``, else the JSON built by ``build`` tagged with it."""
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return ORJSONResponse(build(), headers={"ETag": etag})
 
 
 @app.get("/api/v1/demo/summary")
-def api_demo_summary() -> JSONResponse:
-    return JSONResponse(demo_summary())
+def api_demo_summary(request: Request) -> Response:
+    inputs = (STATEMENT_LINES_CSV, BANK_FEED_CSV, EXPECTED_CSV, CASE_MANIFEST_CSV)
+    etag = _etag_for(*(_csv_key(p) for p in inputs))
+    return _conditional_json(request, etag, demo_summary)
+
+
+@lru_cache(maxsize=4)
+def _run_matching_cached(
+    stmt_key: CsvKey | None, bank_key: CsvKey | None, overrides: tuple[tuple[str, str], ...]
+) -> dict[str, Any]:
+    return run_matching(
+        DATA_DIR, policy_overrides=dict(overrides), statements=_rows_for(stmt_key), cash=_rows_for(bank_key)
+    )
+
+
+def _run_matching() -> dict[str, Any]:
+    """run_matching over the cached statement and bank rows, memoized per file versions and
+    policy overrides. The result is shared, so callers must not mutate it."""
+    overrides = tuple(sorted(load_policy_overrides(DB_PATH).items()))
+    return _run_matching_cached(_csv_key(STATEMENT_LINES_CSV), _csv_key(BANK_FEED_CSV), overrides)
 
 
 @app.get("/api/v1/demo/match-summary")
-def api_match_summary() -> JSONResponse:
-    return JSONResponse(run_matching(DATA_DIR, policy_overrides=load_policy_overrides(DB_PATH)))
+def api_match_summary() -> ORJSONResponse:
+    return ORJSONResponse(_run_matching())
 
 
 @app.post("/api/v1/demo/match-runs")
-def api_create_match_run() -> JSONResponse:
+def api_create_match_run() -> ORJSONResponse:
     run_id = f"{datetime.now(UTC).strftime('run-%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
-    result = run_matching(DATA_DIR, policy_overrides=load_policy_overrides(DB_PATH))
+    result = _run_matching()
     save_counts = save_match_run(DB_PATH, run_id, result["results"])
-    log_audit_event(
+    audit_log.log(
         DB_PATH, event_type="match_run", action="created",
         entity_type="match_run", entity_id=run_id,
         detail=f"auto={save_counts['auto_matched']} review={save_counts['needs_review']} unmatched={save_counts['unmatched']}",
     )
-    return JSONResponse(
+    return ORJSONResponse(
         {
             "ok": True,
             "run_id": run_id,
@@ -168,53 +264,64 @@ def api_create_match_run() -> JSONResponse:
 
 
 @app.get("/api/v1/demo/match-runs")
-def api_list_match_runs(limit: int = 50) -> JSONResponse:
-    rows = list_match_runs(DB_PATH, limit=limit)
-    return JSONResponse({"rows": rows, "count": len(rows)})
+def api_list_match_runs(limit: int = 50) -> ORJSONResponse:
+    rows = _match_runs(_match_state(), limit)
+    return ORJSONResponse({"rows": rows, "count": len(rows)})
+
+
+STATEMENT_DETAIL_FIELDS = ("txn_type", "gross_commission", "insured_name", "carrier_name", "statement_id")
+
+
+@lru_cache(maxsize=4)
+def _statement_details_cached(stmt_key: CsvKey | None) -> dict[str, dict[str, str]]:
+    return {
+        r["line_id"]: {field: r.get(field, "") for field in STATEMENT_DETAIL_FIELDS}
+        for r in _rows_for(stmt_key)
+    }
+
+
+_NO_STATEMENT_DETAILS = dict.fromkeys(STATEMENT_DETAIL_FIELDS, "")
+
+
+def _add_statement_fields(rows: list[dict[str, Any]]) -> None:
+    """Copy STATEMENT_DETAIL_FIELDS from each row's statement line onto it ("" if the line is unknown)."""
+    details = _statement_details_cached(_csv_key(STATEMENT_LINES_CSV))
+    for row in rows:
+        row.update(details.get(row["line_id"], _NO_STATEMENT_DETAILS))
 
 
 @app.get("/api/v1/demo/match-results")
-def api_match_results(status: str | None = None, limit: int = 500) -> JSONResponse:
+def api_match_results(request: Request, status: str | None = None, limit: int = 500) -> Response:
     if status and status not in {"auto_matched", "needs_review", "unmatched", "resolved"}:
         raise HTTPException(status_code=400, detail="invalid status filter")
-    rows, run_id = list_match_results(DB_PATH, status=status, limit=limit)
 
-    # Enrich with statement-level data (txn_type, commission)
-    stmt_rows = _read_csv(DATA_DIR / "raw/statements/statement_lines.csv")
-    stmt_lookup = {r["line_id"]: r for r in stmt_rows}
-    for row in rows:
-        sl = stmt_lookup.get(row["line_id"], {})
-        row["txn_type"] = sl.get("txn_type", "")
-        row["gross_commission"] = sl.get("gross_commission", "")
-        row["insured_name"] = sl.get("insured_name", "")
-        row["carrier_name"] = sl.get("carrier_name", "")
-        row["statement_id"] = sl.get("statement_id", "")
+    def build() -> dict[str, Any]:
+        rows, run_id = list_match_results(DB_PATH, status=status, limit=limit)
+        # Enrich with statement-level data (txn_type, commission)
+        _add_statement_fields(rows)
+        return {"rows": rows, "count": len(rows), "run_id": run_id}
 
-    return JSONResponse({"rows": rows, "count": len(rows), "run_id": run_id})
+    etag = _etag_for(_match_state(), _csv_key(STATEMENT_LINES_CSV))
+    return _conditional_json(request, etag, build)
 
 
 @app.get("/api/v1/demo/exceptions")
-def api_exceptions(status: str = "open", limit: int = 100) -> JSONResponse:
+def api_exceptions(request: Request, status: str = "open", limit: int = 100) -> Response:
     if status not in {"open", "resolved"}:
         raise HTTPException(status_code=400, detail="status must be open or resolved")
-    rows = list_exceptions(DB_PATH, status=status, limit=limit)
 
-    # Enrich with statement-level data
-    stmt_rows = _read_csv(DATA_DIR / "raw/statements/statement_lines.csv")
-    stmt_lookup = {r["line_id"]: r for r in stmt_rows}
-    for row in rows:
-        sl = stmt_lookup.get(row["line_id"], {})
-        row["txn_type"] = sl.get("txn_type", "")
-        row["gross_commission"] = sl.get("gross_commission", "")
-        row["insured_name"] = sl.get("insured_name", "")
-        row["carrier_name"] = sl.get("carrier_name", "")
-        row["statement_id"] = sl.get("statement_id", "")
+    def build() -> dict[str, Any]:
+        rows = list_exceptions(DB_PATH, status=status, limit=limit)
+        # Enrich with statement-level data
+        _add_statement_fields(rows)
+        return {"rows": rows, "count": len(rows)}
 
-    return JSONResponse({"rows": rows, "count": len(rows)})
+    etag = _etag_for(_match_state(), _csv_key(STATEMENT_LINES_CSV))
+    return _conditional_json(request, etag, build)
 
 
 @app.post("/api/v1/demo/exceptions/resolve")
-def api_exceptions_resolve(payload: ResolveExceptionRequest) -> JSONResponse:
+def api_exceptions_resolve(payload: ResolveExceptionRequest) -> ORJSONResponse:
     row = resolve_exception(
         DB_PATH,
         line_id=payload.line_id,
@@ -224,102 +331,110 @@ def api_exceptions_resolve(payload: ResolveExceptionRequest) -> JSONResponse:
     )
     if row is None:
         raise HTTPException(status_code=404, detail="open exception not found for latest run")
-    log_audit_event(
+    audit_log.log(
         DB_PATH, event_type="exception_resolved", action=payload.resolution_action,
         entity_type="line", entity_id=payload.line_id, actor="analyst",
         detail=payload.resolution_note,
         old_value="open", new_value="resolved",
     )
-    return JSONResponse({"ok": True, "resolved": row})
+    return ORJSONResponse({"ok": True, "resolved": row})
 
 
 @app.get("/api/v1/demo/rules/policy")
-def api_policy_rules(limit: int = 200) -> JSONResponse:
+def api_policy_rules(limit: int = 200) -> ORJSONResponse:
     rows = list_policy_rules(DB_PATH, limit=limit)
-    return JSONResponse({"rows": rows, "count": len(rows)})
+    return ORJSONResponse({"rows": rows, "count": len(rows)})
 
 
 @app.post("/api/v1/demo/rules/policy")
-def api_policy_rules_upsert(payload: UpsertPolicyRuleRequest) -> JSONResponse:
+def api_policy_rules_upsert(payload: UpsertPolicyRuleRequest) -> ORJSONResponse:
     source = payload.source_policy_number.strip()
     target = payload.target_policy_number.strip()
     if not source or not target:
         raise HTTPException(status_code=400, detail="source_policy_number and target_policy_number are required")
     row = upsert_policy_rule(DB_PATH, source, target, payload.note)
-    log_audit_event(
+    audit_log.log(
         DB_PATH, event_type="rule_created", action="upsert",
         entity_type="policy_rule", entity_id=source, actor="analyst",
         detail=f"Map {source} → {target}",
         new_value=target,
     )
-    return JSONResponse({"ok": True, "rule": row})
+    return ORJSONResponse({"ok": True, "rule": row})
+
+
+SCORE_FACTOR_LABELS: dict[str, tuple[str, float]] = {
+    "policy_in_memo": ("Policy in Memo", 0.55),
+    "exact_amount": ("Exact Amount", 0.30),
+    "near_amount": ("Near Amount", 0.15),
+    "near_date": ("Near Date", 0.10),
+    "soft_date": ("Soft Date", 0.05),
+    "carrier_match": ("Carrier Match", 0.05),
+    "name_hint": ("Name Hint", 0.05),
+    "policy_rule_override": ("Policy Rule", 0.00),
+}
+# One known factor key per comma-separated item of a reason string, surrounding whitespace ignored
+_SCORE_FACTOR_RE = re.compile(
+    r"(?:^|,)\s*(" + "|".join(map(re.escape, SCORE_FACTOR_LABELS)) + r")\s*(?=,|$)"
+)
+
+
+@lru_cache(maxsize=64)
+def _score_factors(reason: str) -> tuple[dict[str, Any], ...]:
+    """Labelled score factors for a match reason string; there are only a few distinct reasons."""
+    factors = []
+    for m in _SCORE_FACTOR_RE.finditer(reason):
+        key = m.group(1)
+        label, weight = SCORE_FACTOR_LABELS[key]
+        factors.append({"key": key, "label": label, "weight": weight})
+    return tuple(factors)
+
+
+@lru_cache(maxsize=4)
+def _statement_ams_join_cached(
+    stmt_key: CsvKey | None, expected_key: CsvKey | None,
+) -> dict[str, tuple[dict[str, Any], dict[str, Any] | None]]:
+    """line_id → (statement row, AMS row at the same position or None); first occurrence wins."""
+    stmt_rows = _rows_for(stmt_key)
+    expected_rows = _rows_for(expected_key)
+    return {
+        line_id: (stmt_rows[i], expected_rows[i] if i < len(expected_rows) else None)
+        for line_id, i in _positions_cached(stmt_key, "line_id").items()
+    }
 
 
 @app.get("/api/v1/demo/line-detail/{line_id}")
-def api_line_detail(line_id: str) -> JSONResponse:
+def api_line_detail(line_id: str) -> ORJSONResponse:
     """Full detail for a single statement line: statement + match + bank + AMS expected."""
-    # Statement data
-    stmt_rows = _read_csv(DATA_DIR / "raw/statements/statement_lines.csv")
-    stmt = next((r for r in stmt_rows if r["line_id"] == line_id), None)
-    if stmt is None:
+    # Statement line and its AMS expected row (statement uses potentially-mutated
+    # policy; expected uses original, so they are joined by line index)
+    joined = _statement_ams_join_cached(_csv_key(STATEMENT_LINES_CSV), _csv_key(EXPECTED_CSV)).get(line_id)
+    if joined is None:
         raise HTTPException(status_code=404, detail="line_id not found")
-
-    # AMS expected data (keyed by original policy number from index)
-    expected_rows = _read_csv(DATA_DIR / "expected/ams_expected.csv")
-    # Statement uses potentially-mutated policy; expected uses original. Match by line index.
-    line_idx = next((i for i, r in enumerate(stmt_rows) if r["line_id"] == line_id), None)
-    ams = expected_rows[line_idx] if line_idx is not None and line_idx < len(expected_rows) else None
+    stmt, ams = joined
 
     # Match result from DB
-    from app.persistence import latest_run_id, get_conn
-    run_id = latest_run_id(DB_PATH)
     match_result = None
     exception_data = None
-    if run_id:
-        with get_conn(DB_PATH) as conn:
-            mr = conn.execute(
-                """SELECT line_id, policy_number, matched_bank_txn_id, confidence, status, reason
-                   FROM match_results WHERE run_id = ? AND line_id = ?""",
-                (run_id, line_id),
-            ).fetchone()
-            if mr:
-                match_result = dict(mr)
-            ex = conn.execute(
-                """SELECT * FROM exceptions WHERE run_id = ? AND line_id = ?""",
-                (run_id, line_id),
-            ).fetchone()
-            if ex:
-                exception_data = dict(ex)
+    with db_pool.connection() as conn:
+        run_id = select_latest_run_id(conn)
+        if run_id:
+            match_result, exception_data = select_line_match(conn, run_id, line_id)
 
     # Bank transaction
     bank_txn = None
     if match_result and match_result.get("matched_bank_txn_id"):
-        bank_rows = _read_csv(DATA_DIR / "raw/bank/bank_feed.csv")
-        bank_txn = next((r for r in bank_rows if r["bank_txn_id"] == match_result["matched_bank_txn_id"]), None)
+        bank_txn = _index_csv(BANK_FEED_CSV, "bank_txn_id").get(match_result["matched_bank_txn_id"])
 
     # Score breakdown (reconstruct from reason string)
     score_factors = []
     if match_result and match_result.get("reason"):
-        factor_labels = {
-            "policy_in_memo": ("Policy in Memo", 0.55),
-            "exact_amount": ("Exact Amount", 0.30),
-            "near_amount": ("Near Amount", 0.15),
-            "near_date": ("Near Date", 0.10),
-            "soft_date": ("Soft Date", 0.05),
-            "carrier_match": ("Carrier Match", 0.05),
-            "name_hint": ("Name Hint", 0.05),
-            "policy_rule_override": ("Policy Rule", 0.00),
-        }
-        for part in match_result["reason"].split(","):
-            part = part.strip()
-            if part in factor_labels:
-                label, weight = factor_labels[part]
-                score_factors.append({"key": part, "label": label, "weight": weight})
+        score_factors = list(_score_factors(match_result["reason"]))
 
     # Audit events for this line
+    audit_log.flush()
     audit = list_audit_events(DB_PATH, entity_type="line", entity_id=line_id, limit=50)
 
-    return JSONResponse({
+    return ORJSONResponse({
         "statement": stmt,
         "ams_expected": ams,
         "match_result": match_result,
@@ -331,77 +446,45 @@ def api_line_detail(line_id: str) -> JSONResponse:
 
 
 @app.get("/api/v1/demo/revenue/summary")
-def api_revenue_summary() -> JSONResponse:
+def api_revenue_summary() -> ORJSONResponse:
     """Revenue vs expected analysis: expected, received, variance by carrier and LOB."""
-    stmt_rows = _read_csv(DATA_DIR / "raw/statements/statement_lines.csv")
-    expected_rows = _read_csv(DATA_DIR / "expected/ams_expected.csv")
-    bank_rows = _read_csv(DATA_DIR / "raw/bank/bank_feed.csv")
-
-    # Build lookup: line index → statement data + expected data
-    # AMS expected is keyed by position (same order as statement lines)
-    line_data: list[dict] = []
-    for i, stmt in enumerate(stmt_rows):
-        ams = expected_rows[i] if i < len(expected_rows) else {}
-        line_data.append({
-            "line_id": stmt["line_id"],
-            "carrier": stmt["carrier_name"],
-            "lob": ams.get("lob", "Unknown"),
-            "producer_id": ams.get("producer_id", ""),
-            "expected": float(ams.get("expected_commission", 0)),
-            "statement": float(stmt.get("gross_commission", 0)),
-            "txn_type": stmt.get("txn_type", ""),
-        })
+    return ORJSONResponse(_revenue_summary_cached(
+        _match_state(),
+        _csv_key(STATEMENT_LINES_CSV), _csv_key(EXPECTED_CSV), _csv_key(BANK_FEED_CSV),
+    ))
+
+
+@lru_cache(maxsize=4)
+def _revenue_summary_cached(
+    state: MatchState, stmt_key: CsvKey | None, expected_key: CsvKey | None, bank_key: CsvKey | None,
+) -> dict[str, Any]:
+    csv_keys = (stmt_key, expected_key)
+    cols = _statement_columns_cached(*csv_keys)
+    bank_amounts = _bank_amount_column_cached(bank_key)
 
-    # Match result lookup for actual received amounts
-    from app.persistence import latest_run_id, get_conn
-    run_id = latest_run_id(DB_PATH)
-    match_status: dict[str, str] = {}
-    if run_id:
-        with get_conn(DB_PATH) as conn:
-            rows = conn.execute(
-                "SELECT line_id, status FROM match_results WHERE run_id = ?",
-                (run_id,),
-            ).fetchall()
-            match_status = {r["line_id"]: r["status"] for r in rows}
+    statuses = _line_statuses_cached(state, *csv_keys)
 
     # Bank amounts indexed by txn_id
-    bank_total = sum(float(r.get("amount", 0)) for r in bank_rows)
-
-    # Aggregate by carrier
-    carrier_agg: dict[str, dict] = {}
-    lob_agg: dict[str, dict] = {}
-    totals = {"expected": 0.0, "statement": 0.0, "matched": 0.0, "unmatched": 0.0, "clawbacks": 0.0}
-
-    for ld in line_data:
-        carrier = ld["carrier"]
-        lob = ld["lob"]
-        status = match_status.get(ld["line_id"], "unknown")
-
-        for key, agg in [("carrier", carrier_agg), ("lob", lob_agg)]:
-            bucket_key = carrier if key == "carrier" else lob
-            if bucket_key not in agg:
-                agg[bucket_key] = {"expected": 0.0, "statement": 0.0, "matched": 0.0,
-                                   "unmatched": 0.0, "clawbacks": 0.0, "lines": 0, "matched_lines": 0}
-            b = agg[bucket_key]
-            b["expected"] += ld["expected"]
-            b["statement"] += abs(ld["statement"])
-            b["lines"] += 1
-            if ld["txn_type"] == "clawback":
-                b["clawbacks"] += ld["statement"]
-            if status in ("auto_matched", "resolved"):
-                b["matched"] += abs(ld["statement"])
-                b["matched_lines"] += 1
-            elif status in ("needs_review", "unmatched", "unknown"):
-                b["unmatched"] += abs(ld["statement"])
+    bank_total = sum(bank_amounts)
 
-        totals["expected"] += ld["expected"]
-        totals["statement"] += abs(ld["statement"])
-        if ld["txn_type"] == "clawback":
-            totals["clawbacks"] += ld["statement"]
+    # Status-independent sums are cached per CSV version; only match-dependent fields are tallied here
+    base_carrier, base_lob, base_totals = _revenue_baseline_cached(*csv_keys)
+    carrier_agg = {k: {**v, "matched": 0.0, "unmatched": 0.0, "matched_lines": 0} for k, v in base_carrier.items()}
+    lob_agg = {k: {**v, "matched": 0.0, "unmatched": 0.0, "matched_lines": 0} for k, v in base_lob.items()}
+    totals = {**base_totals, "matched": 0.0, "unmatched": 0.0}
+
+    for status, carrier, lob, statement in zip(statuses, cols.carrier, cols.lob, cols.statement):
+        abs_statement = abs(statement)
         if status in ("auto_matched", "resolved"):
-            totals["matched"] += abs(ld["statement"])
+            for b in (carrier_agg[carrier], lob_agg[lob]):
+                b["matched"] += abs_statement
+                b["matched_lines"] += 1
+            totals["matched"] += abs_statement
         else:
-            totals["unmatched"] += abs(ld["statement"])
+            if status in ("needs_review", "unmatched", "unknown"):
+                carrier_agg[carrier]["unmatched"] += abs_statement
+                lob_agg[lob]["unmatched"] += abs_statement
+            totals["unmatched"] += abs_statement
 
     def round_agg(agg: dict) -> list[dict]:
         result = []
@@ -424,7 +507,7 @@ def api_revenue_summary() -> JSONResponse:
         return result
 
     totals_variance = totals["statement"] - totals["expected"]
-    return JSONResponse({
+    return {
         "totals": {
             "expected": round(totals["expected"], 2),
             "statement": round(totals["statement"], 2),
@@ -434,53 +517,454 @@ def api_revenue_summary() -> JSONResponse:
             "variance": round(totals_variance, 2),
             "variance_pct": round(totals_variance / totals["expected"] * 100, 1) if totals["expected"] else 0,
             "bank_total": round(bank_total, 2),
-            "lines": len(line_data),
+            "lines": len(cols.line_id),
         },
         "by_carrier": round_agg(carrier_agg),
         "by_lob": round_agg(lob_agg),
-    })
+    }
+
+
+# CSVs at least this large are decoded in one call straight from a read-only memory
+# map, skipping the buffered reader's chunked reads and per-chunk decoding.
+CSV_MMAP_MIN_BYTES = 10 * 1024 * 1024
+
+
+@lru_cache(maxsize=32)
+def _read_csv_cached(path_str: str, mtime_ns: int, size: int) -> tuple[dict[str, Any], ...]:
+    if size >= CSV_MMAP_MIN_BYTES:
+        with open(path_str, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = str(mm, "utf-8")
+        # newline="" as with open(): quoted fields keep their embedded line breaks
+        return tuple(csv.DictReader(io.StringIO(text, newline="")))
+    with open(path_str, newline="", encoding="utf-8") as f:
+        return tuple(csv.DictReader(f))
+
+
+CsvKey = tuple[str, int, int]
+
+
+def _csv_key(path: Path) -> CsvKey | None:
+    """Cache key identifying the current version of a CSV, or None if missing."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+
+def _rows_for(key: CsvKey | None) -> tuple[dict[str, Any], ...]:
+    return _read_csv_cached(*key) if key else ()
+
+
+def _read_csv(path: Path) -> tuple[dict[str, Any], ...]:
+    """Parsed rows of a CSV, memoized until the file's mtime or size changes.
+
+    Rows are shared across requests, so callers must copy before mutating.
+    """
+    return _rows_for(_csv_key(path))
+
+
+def _warm_csv_caches() -> None:
+    """Parse the statement, AMS and bank feed CSVs concurrently so their file reads overlap."""
+    paths = (STATEMENT_LINES_CSV, EXPECTED_CSV, BANK_FEED_CSV)
+    with ThreadPoolExecutor(max_workers=len(paths)) as ex:
+        for _ in ex.map(_read_csv, paths):
+            pass
+
+
+@lru_cache(maxsize=16)
+def _index_csv_cached(key: CsvKey | None, column: str) -> dict[str, dict[str, Any]]:
+    return {r[column]: r for r in _rows_for(key)}
+
+
+def _index_csv(path: Path, column: str) -> dict[str, dict[str, Any]]:
+    """Rows of a CSV keyed by ``column``, cached per file version like _read_csv."""
+    return _index_csv_cached(_csv_key(path), column)
+
+
+@lru_cache(maxsize=16)
+def _positions_cached(key: CsvKey | None, column: str) -> dict[str, int]:
+    positions: dict[str, int] = {}
+    for i, r in enumerate(_rows_for(key)):
+        positions.setdefault(r[column], i)
+    return positions
+
+
+@lru_cache(maxsize=16)
+def _distinct_values_cached(key: CsvKey | None, column: str) -> tuple[str, ...]:
+    return tuple(sorted({r.get(column, "") for r in _rows_for(key)}))
+
+
+@lru_cache(maxsize=16)
+def _lowered_column_cached(key: CsvKey | None, column: str) -> tuple[str, ...]:
+    """Lower-cased values of a CSV column in file order, for case-insensitive filters."""
+    return tuple(r.get(column, "").lower() for r in _rows_for(key))
+
+
+def _distinct_values(path: Path, column: str) -> tuple[str, ...]:
+    """Sorted distinct values of a CSV column, cached per file version."""
+    return _distinct_values_cached(_csv_key(path), column)
+
+
+@lru_cache(maxsize=4)
+def _statements_by_carrier_cached(key: CsvKey | None) -> dict[str, dict[str, tuple[dict[str, Any], ...]]]:
+    grouped: dict[str, dict[str, list[dict[str, Any]]]] = {}
+    for r in _rows_for(key):
+        grouped.setdefault(r["carrier_name"], {}).setdefault(r["statement_id"], []).append(r)
+    return {
+        carrier: {stmt_id: tuple(rows) for stmt_id, rows in by_stmt.items()}
+        for carrier, by_stmt in grouped.items()
+    }
+
+
+def _statements_by_carrier() -> dict[str, dict[str, tuple[dict[str, Any], ...]]]:
+    """carrier → statement_id → statement lines, in file order; cached per file version."""
+    return _statements_by_carrier_cached(_csv_key(STATEMENT_LINES_CSV))
+
+
+def _producer_ids() -> list[str]:
+    """Sorted non-empty producer ids from the AMS extract."""
+    return [pid for pid in _distinct_values(EXPECTED_CSV, "producer_id") if pid]
+
+
+@dataclass(frozen=True)
+class StatementColumns:
+    """Statement lines joined to the AMS extract, stored column-wise with typed values.
+
+    The AMS extract has no line_id; row i describes statement line i.
+    """
+    line_id: tuple[str, ...]
+    policy_number: tuple[str, ...]
+    carrier: tuple[str, ...]
+    lob: tuple[str, ...]
+    producer_id: tuple[str, ...]
+    office: tuple[str, ...]
+    statement_id: tuple[str, ...]
+    txn_type: tuple[str, ...]
+    written_premium: tuple[float, ...]
+    expected: tuple[float, ...]
+    statement: tuple[float, ...]
+    expected_rounded: tuple[float, ...]
+    statement_rounded: tuple[float, ...]
+
+
+@lru_cache(maxsize=4)
+def _statement_columns_cached(stmt_key: CsvKey | None, expected_key: CsvKey | None) -> StatementColumns:
+    stmt_rows = _rows_for(stmt_key)
+    expected_rows = _rows_for(expected_key)
+    ams_rows = [expected_rows[i] if i < len(expected_rows) else {} for i in range(len(stmt_rows))]
+    expected = tuple(float(a.get("expected_commission", 0)) for a in ams_rows)
+    statement = tuple(float(r.get("gross_commission", 0)) for r in stmt_rows)
+    return StatementColumns(
+        line_id=tuple(r["line_id"] for r in stmt_rows),
+        policy_number=tuple(r["policy_number"] for r in stmt_rows),
+        carrier=tuple(r["carrier_name"] for r in stmt_rows),
+        lob=tuple(a.get("lob", "Unknown") for a in ams_rows),
+        producer_id=tuple(a.get("producer_id", "Unknown") for a in ams_rows),
+        office=tuple(a.get("office", "") for a in ams_rows),
+        statement_id=tuple(r.get("statement_id", "") for r in stmt_rows),
+        txn_type=tuple(r.get("txn_type", "") for r in stmt_rows),
+        written_premium=tuple(float(r.get("written_premium", 0)) for r in stmt_rows),
+        expected=expected,
+        statement=statement,
+        expected_rounded=tuple(round(v, 2) for v in expected),
+        statement_rounded=tuple(round(v, 2) for v in statement),
+    )
+
+
+@lru_cache(maxsize=4)
+def _producer_lines_cached(stmt_key: CsvKey | None, expected_key: CsvKey | None) -> dict[str, tuple[int, ...]]:
+    """producer_id → positions of that producer's statement lines."""
+    positions: dict[str, list[int]] = defaultdict(list)
+    for i, producer_id in enumerate(_statement_columns_cached(stmt_key, expected_key).producer_id):
+        positions[producer_id].append(i)
+    return {producer_id: tuple(idx) for producer_id, idx in positions.items()}
+
+
+def _statement_columns() -> StatementColumns:
+    return _statement_columns_cached(_csv_key(STATEMENT_LINES_CSV), _csv_key(EXPECTED_CSV))
+
+
+def _new_revenue_bucket() -> dict[str, Any]:
+    return {"expected": 0.0, "statement": 0.0, "clawbacks": 0.0, "lines": 0}
+
+
+@lru_cache(maxsize=4)
+def _revenue_baseline_cached(
+    stmt_key: CsvKey | None, expected_key: CsvKey | None,
+) -> tuple[dict[str, dict], dict[str, dict], dict[str, float]]:
+    """Per-carrier and per-LOB revenue sums that don't depend on match status.
+
+    Returned dicts are shared across requests; copy before accumulating into them.
+    """
+    cols = _statement_columns_cached(stmt_key, expected_key)
+    carrier_agg: defaultdict[str, dict] = defaultdict(_new_revenue_bucket)
+    lob_agg: defaultdict[str, dict] = defaultdict(_new_revenue_bucket)
+    totals = {"expected": 0.0, "statement": 0.0, "clawbacks": 0.0}
+    for carrier, lob, expected, statement, txn_type in zip(
+        cols.carrier, cols.lob, cols.expected, cols.statement, cols.txn_type,
+    ):
+        abs_statement = abs(statement)
+        is_clawback = txn_type == "clawback"
+        for agg, bucket_key in ((carrier_agg, carrier), (lob_agg, lob)):
+            b = agg[bucket_key]
+            b["expected"] += expected
+            b["statement"] += abs_statement
+            b["lines"] += 1
+            if is_clawback:
+                b["clawbacks"] += statement
+        totals["expected"] += expected
+        totals["statement"] += abs_statement
+        if is_clawback:
+            totals["clawbacks"] += statement
+    return dict(carrier_agg), dict(lob_agg), totals
+
+
+@lru_cache(maxsize=4)
+def _carrier_baseline_cached(
+    stmt_key: CsvKey | None, expected_key: CsvKey | None,
+) -> dict[str, dict[str, Any]]:
+    """Per-carrier scorecard figures that don't depend on match status.
+
+    Returned dicts are shared across requests; copy before accumulating into them.
+    """
+    cols = _statement_columns_cached(stmt_key, expected_key)
+    carrier_agg: dict[str, dict[str, Any]] = {}
+    statements: dict[str, set[str]] = defaultdict(set)
+    for carrier, statement_id, txn_type, premium, commission in zip(
+        cols.carrier, cols.statement_id, cols.txn_type, cols.written_premium, cols.statement,
+    ):
+        b = carrier_agg.setdefault(carrier, {
+            "carrier": carrier,
+            "statements": 0,
+            "lines": 0,
+            "total_premium": 0.0,
+            "total_commission": 0.0,
+            "clawbacks": 0,
+            "clawback_amount": 0.0,
+        })
+        statements[carrier].add(statement_id)
+        b["lines"] += 1
+        b["total_premium"] += premium
+        b["total_commission"] += commission
+        if txn_type == "clawback":
+            b["clawbacks"] += 1
+            b["clawback_amount"] += commission
+    for carrier, b in carrier_agg.items():
+        b["statements"] = len(statements[carrier])
+    return carrier_agg
+
+
+@lru_cache(maxsize=4)
+def _producer_baseline_cached(
+    stmt_key: CsvKey | None, expected_key: CsvKey | None,
+) -> dict[str, dict[str, Any]]:
+    """Per-producer commission figures that don't depend on match status.
+
+    Keyed in first-seen order; returned dicts are shared across requests.
+    """
+    cols = _statement_columns_cached(stmt_key, expected_key)
+    producer_agg: dict[str, dict[str, Any]] = {}
+    carriers: dict[str, set[str]] = defaultdict(set)
+    lobs: dict[str, set[str]] = defaultdict(set)
+    for producer_id, office, lob, carrier, txn_type, commission, expected in zip(
+        cols.producer_id, cols.office, cols.lob, cols.carrier, cols.txn_type,
+        cols.statement, cols.expected,
+    ):
+        p = producer_agg.setdefault(producer_id, {
+            "producer_id": producer_id,
+            "office": office,
+            "total_commission": 0.0,
+            "total_expected": 0.0,
+            "clawbacks": 0.0,
+            "lines": 0,
+        })
+        p["total_commission"] += commission
+        p["total_expected"] += expected
+        p["lines"] += 1
+        carriers[producer_id].add(carrier)
+        lobs[producer_id].add(lob)
+        if txn_type == "clawback":
+            p["clawbacks"] += commission
+    for producer_id, p in producer_agg.items():
+        p["carriers"] = tuple(sorted(carriers[producer_id]))
+        p["lobs"] = tuple(sorted(lobs[producer_id]))
+    return producer_agg
+
+
+@lru_cache(maxsize=4)
+def _txn_dates_cached(stmt_key: CsvKey | None) -> tuple[date | None, ...]:
+    """Parsed txn_date per statement line; None where the date is missing or malformed."""
+    dates: list[date | None] = []
+    for r in _rows_for(stmt_key):
+        try:
+            dates.append(date.fromisoformat(r.get("txn_date", "")[:10]))
+        except (ValueError, TypeError):
+            dates.append(None)
+    return tuple(dates)
+
+
+@lru_cache(maxsize=4)
+def _line_ages_cached(stmt_key: CsvKey | None, today: date) -> tuple[int, ...]:
+    """Days from each line's txn_date to ``today``; 0 where the date is unusable."""
+    return tuple((today - d).days if d else 0 for d in _txn_dates_cached(stmt_key))
+
+
+@lru_cache(maxsize=4)
+def _line_age_buckets_cached(stmt_key: CsvKey | None, today: date) -> tuple[str, ...]:
+    """AGE_BUCKETS label per statement line for ``today``."""
+    return tuple(AGE_BUCKETS[bisect_left(AGE_BUCKET_MAX_DAYS, age)] for age in _line_ages_cached(stmt_key, today))
+
+
+@lru_cache(maxsize=4)
+def _bank_amount_column_cached(bank_key: CsvKey | None) -> tuple[float, ...]:
+    """Parsed amount per bank feed row, in file order."""
+    return tuple(float(r.get("amount", 0)) for r in _rows_for(bank_key))
+
+
+@lru_cache(maxsize=4)
+def _bank_amounts_cached(bank_key: CsvKey | None) -> dict[str, float]:
+    rows = _rows_for(bank_key)
+    return {r["bank_txn_id"]: amount for r, amount in zip(rows, _bank_amount_column_cached(bank_key))}
+
+
+def _bank_amounts() -> dict[str, float]:
+    """bank_txn_id → parsed amount for the current bank feed."""
+    return _bank_amounts_cached(_csv_key(BANK_FEED_CSV))
+
+
+@lru_cache(maxsize=4)
+def _cash_coverage_cents_cached(
+    stmt_key: CsvKey | None, expected_key: CsvKey | None, bank_key: CsvKey | None
+) -> tuple[int, int]:
+    """(sum of |statement commission|, sum of |bank amount|) in integer cents for these file versions."""
+    statement_cents = sum(abs(round(v * 100)) for v in _statement_columns_cached(stmt_key, expected_key).statement)
+    bank_cents = sum(abs(round(v * 100)) for v in _bank_amount_column_cached(bank_key))
+    return statement_cents, bank_cents
 
 
-def _read_csv(path: Path) -> list[dict[str, Any]]:
-    if not path.exists():
-        return []
-    with path.open(newline="", encoding="utf-8") as f:
-        return list(csv.DictReader(f))
+# Fingerprint of the match data in the database: number of runs, the latest run and
+# its resolved-exception count and newest exception update. Runs and resolutions
+# both change it, whichever process (or direct SQL) wrote them.
+_MATCH_STATE_SQL = """
+    SELECT (SELECT COUNT(*) FROM match_runs) AS runs,
+           latest.run_id,
+           (SELECT COUNT(*) FROM exceptions e
+             WHERE e.run_id = latest.run_id AND e.status = 'resolved') AS resolved,
+           (SELECT MAX(e.updated_at) FROM exceptions e WHERE e.run_id = latest.run_id) AS updated_at
+      FROM (SELECT run_id FROM match_runs ORDER BY created_at DESC LIMIT 1) AS latest
+"""
+# Keyed on the whole fingerprint, the match caches never serve results from before a
+# write, whoever made it; stale entries just age out of the LRU.
+MatchState = tuple[Any, ...] | None
+
+
+def _match_state() -> MatchState:
+    """Current match-data fingerprint (None before the first run)."""
+    with db_pool.connection() as conn:
+        row = conn.execute(_MATCH_STATE_SQL).fetchone()
+    return None if row is None else tuple(row)
+
+
+def _latest_run_id() -> str | None:
+    """Latest run id, for callers that read match results without caching them."""
+    state = _match_state()
+    return None if state is None else state[1]
+
+
+# Every cache derived from match results takes the MatchState as its first argument
+# and reads the run id from it.
+
+@lru_cache(maxsize=8)
+def _matched_by_txn(state: MatchState) -> dict[str, dict[str, Any]]:
+    """bank_txn_id → first match result claiming it in the latest run."""
+    matched_by_txn: dict[str, dict[str, Any]] = {}
+    if state is None:
+        return matched_by_txn
+    with db_pool.connection() as conn:
+        rows = conn.execute(
+            """SELECT line_id, policy_number, matched_bank_txn_id, status, confidence
+               FROM match_results WHERE run_id = ? AND matched_bank_txn_id IS NOT NULL""",
+            (state[1],),
+        ).fetchall()
+    for r in rows:
+        txn_id = r["matched_bank_txn_id"]
+        if txn_id not in matched_by_txn:
+            matched_by_txn[txn_id] = {
+                "line_id": r["line_id"],
+                "policy_number": r["policy_number"],
+                "match_status": r["status"],
+                "confidence": r["confidence"],
+            }
+    return matched_by_txn
+
+
+@lru_cache(maxsize=8)
+def _match_map(state: MatchState) -> dict[str, dict[str, Any]]:
+    """line_id → match result (status, reason, confidence, matched bank txn) for the latest run."""
+    if state is None:
+        return {}
+    with db_pool.connection() as conn:
+        rows = conn.execute(
+            """SELECT line_id, matched_bank_txn_id, status, reason, confidence
+               FROM match_results WHERE run_id = ?""",
+            (state[1],),
+        ).fetchall()
+    return {r["line_id"]: dict(r) for r in rows}
+
+
+_NO_MATCH: dict[str, Any] = {}
+
+
+@lru_cache(maxsize=4)
+def _line_matches_cached(
+    state: MatchState, stmt_key: CsvKey | None, expected_key: CsvKey | None,
+) -> tuple[dict[str, Any], ...]:
+    """Match result per statement line in file order (_NO_MATCH where there is none).
+
+    Joins the run's results to the statement once, so per-line loops can zip over it.
+    """
+    match_map = _match_map(state)
+    line_ids = _statement_columns_cached(stmt_key, expected_key).line_id
+    return tuple(match_map.get(line_id, _NO_MATCH) for line_id in line_ids)
+
+
+@lru_cache(maxsize=4)
+def _line_statuses_cached(
+    state: MatchState, stmt_key: CsvKey | None, expected_key: CsvKey | None,
+) -> tuple[str, ...]:
+    """Match status per statement line in file order; "unknown" without a result."""
+    return tuple(mr.get("status", "unknown") for mr in _line_matches_cached(state, stmt_key, expected_key))
+
+
+@lru_cache(maxsize=8)
+def _match_runs(state: MatchState, limit: int) -> tuple[dict[str, Any], ...]:
+    """Most recent match runs with per-status counts, newest first."""
+    return tuple(list_match_runs(DB_PATH, limit=limit))
 
 
 @app.get("/api/v1/demo/bank-transactions")
 def api_bank_transactions(
     counterparty: str | None = None,
     limit: int = 500,
-) -> JSONResponse:
-    bank_rows = _read_csv(DATA_DIR / "raw/bank/bank_feed.csv")
+) -> ORJSONResponse:
+    bank_key = _csv_key(BANK_FEED_CSV)
+    bank_rows = _rows_for(bank_key)
 
+    # Rows are parsed once per file version, so only the filter can stop early.
     if counterparty:
-        bank_rows = [r for r in bank_rows if counterparty.lower() in r.get("counterparty", "").lower()]
+        needle = counterparty.lower()
+        lowered = _lowered_column_cached(bank_key, "counterparty")
+        matching = (r for r, value in zip(bank_rows, lowered) if needle in value)
+        page = list(islice(matching, limit)) if limit >= 0 else list(matching)[:limit]
+    else:
+        page = bank_rows[:limit]
 
     # Build match lookup from latest run
-    from app.persistence import latest_run_id, get_conn
-    run_id = latest_run_id(DB_PATH)
-    matched_by_txn: dict[str, dict] = {}
-    if run_id:
-        with get_conn(DB_PATH) as conn:
-            rows = conn.execute(
-                """SELECT line_id, policy_number, matched_bank_txn_id, status, confidence
-                   FROM match_results WHERE run_id = ? AND matched_bank_txn_id IS NOT NULL""",
-                (run_id,),
-            ).fetchall()
-            for r in rows:
-                txn_id = r["matched_bank_txn_id"]
-                if txn_id not in matched_by_txn:
-                    matched_by_txn[txn_id] = {
-                        "line_id": r["line_id"],
-                        "policy_number": r["policy_number"],
-                        "match_status": r["status"],
-                        "confidence": r["confidence"],
-                    }
+    matched_by_txn = _matched_by_txn(_match_state())
 
     result = []
-    for row in bank_rows[:limit]:
+    for row in page:
         txn_id = row.get("bank_txn_id", "")
         match_info = matched_by_txn.get(txn_id)
         result.append({
@@ -492,9 +976,9 @@ def api_bank_transactions(
         })
 
     # Carrier list for filter dropdown
-    carriers = sorted(set(r.get("counterparty", "") for r in _read_csv(DATA_DIR / "raw/bank/bank_feed.csv")))
+    carriers = _distinct_values_cached(bank_key, "counterparty")
 
-    return JSONResponse({"rows": result, "count": len(result), "carriers": carriers})
+    return ORJSONResponse({"rows": result, "count": len(result), "carriers": carriers})
 
 
 STATEMENTS_DIR = DATA_DIR / "raw/statements"
@@ -509,9 +993,10 @@ def api_audit_events(
     entity_type: str | None = None,
     entity_id: str | None = None,
     limit: int = 200,
-) -> JSONResponse:
+) -> ORJSONResponse:
+    audit_log.flush()
     rows = list_audit_events(DB_PATH, entity_type=entity_type, entity_id=entity_id, limit=limit)
-    return JSONResponse({"rows": rows, "count": len(rows)})
+    return ORJSONResponse({"rows": rows, "count": len(rows)})
 
 
 # ---------------------------------------------------------------------------
@@ -519,38 +1004,59 @@ def api_audit_events(
 # ---------------------------------------------------------------------------
 
 @app.get("/api/v1/demo/accruals")
-def api_accruals() -> JSONResponse:
+def api_accruals() -> ORJSONResponse:
     """Generate accrual entries: expected vs paid vs earned per line."""
-    stmt_rows = _read_csv(DATA_DIR / "raw/statements/statement_lines.csv")
-    expected_rows = _read_csv(DATA_DIR / "expected/ams_expected.csv")
-    bank_rows = _read_csv(DATA_DIR / "raw/bank/bank_feed.csv")
-
-    from app.persistence import latest_run_id, get_conn
-    run_id = latest_run_id(DB_PATH)
-    match_map: dict[str, dict] = {}
-    if run_id:
-        with get_conn(DB_PATH) as conn:
-            rows = conn.execute(
-                """SELECT line_id, matched_bank_txn_id, status, confidence
-                   FROM match_results WHERE run_id = ?""",
-                (run_id,),
-            ).fetchall()
-            match_map = {r["line_id"]: dict(r) for r in rows}
-
-    bank_lookup = {r["bank_txn_id"]: float(r.get("amount", 0)) for r in bank_rows}
+    return ORJSONResponse(_compute_accruals())
 
-    accrual_entries = []
-    totals = {"expected": 0.0, "on_statement": 0.0, "cash_received": 0.0, "accrued": 0.0, "true_up": 0.0}
 
-    for i, stmt in enumerate(stmt_rows):
-        ams = expected_rows[i] if i < len(expected_rows) else {}
-        expected = float(ams.get("expected_commission", 0))
-        on_statement = float(stmt.get("gross_commission", 0))
-        mr = match_map.get(stmt["line_id"], {})
-        cash_received = 0.0
-        if mr.get("matched_bank_txn_id"):
-            cash_received = bank_lookup.get(mr["matched_bank_txn_id"], 0.0)
+def _new_accrual_bucket() -> dict[str, Any]:
+    return {"expected": 0, "on_statement": 0, "cash_received": 0, "accrued": 0, "lines": 0, "settled": 0}
+
+
+@lru_cache(maxsize=4)
+def _line_match_columns_cached(
+    state: MatchState, stmt_key: CsvKey | None, expected_key: CsvKey | None, bank_key: CsvKey | None,
+) -> tuple[tuple[str, ...], tuple[float, ...]]:
+    """Per statement line, in file order: match status ("unknown" without a result) and the
+    amount of the bank transaction it is matched to (0.0 if none)."""
+    bank_lookup = _bank_amounts_cached(bank_key)
+    cash = []
+    for mr in _line_matches_cached(state, stmt_key, expected_key):
+        txn_id = mr.get("matched_bank_txn_id")
+        cash.append(bank_lookup.get(txn_id, 0.0) if txn_id else 0.0)
+    return _line_statuses_cached(state, stmt_key, expected_key), tuple(cash)
+
+
+def _compute_accruals() -> dict[str, Any]:
+    """Accrual payload for the latest run, memoized on the run and input CSV versions.
+
+    The payload is shared between the JSON endpoint and the CSV export; don't mutate it.
+    """
+    return _accruals_cached(
+        _match_state(),
+        _csv_key(STATEMENT_LINES_CSV), _csv_key(EXPECTED_CSV), _csv_key(BANK_FEED_CSV),
+    )
+
 
+@lru_cache(maxsize=4)
+def _accruals_cached(
+    state: MatchState, stmt_key: CsvKey | None, expected_key: CsvKey | None, bank_key: CsvKey | None,
+) -> dict[str, Any]:
+    cols = _statement_columns_cached(stmt_key, expected_key)
+    match_statuses, matched_cash = _line_match_columns_cached(state, stmt_key, expected_key, bank_key)
+
+    accrual_entries = []
+    totals = {"expected": 0.0, "on_statement": 0.0, "cash_received": 0.0, "accrued": 0.0, "true_up": 0.0}
+    # Carrier summary, tallied from the rounded entry values as they are emitted
+    carrier_agg: defaultdict[str, dict] = defaultdict(_new_accrual_bucket)
+
+    for (
+        line_id, policy_number, carrier, expected, on_statement, expected_rounded, on_statement_rounded,
+        match_status, cash_received,
+    ) in zip(
+        cols.line_id, cols.policy_number, cols.carrier, cols.expected, cols.statement,
+        cols.expected_rounded, cols.statement_rounded, match_statuses, matched_cash,
+    ):
         accrued = on_statement - cash_received if on_statement > 0 else 0.0
         true_up = cash_received - expected if cash_received else 0.0
         status = "settled" if abs(accrued) < 0.01 else "accrued"
@@ -563,32 +1069,28 @@ def api_accruals() -> JSONResponse:
         totals["accrued"] += max(accrued, 0)
         totals["true_up"] += true_up
 
+        cash_rounded = round(cash_received, 2)
+        accrued_rounded = round(accrued, 2)
         accrual_entries.append({
-            "line_id": stmt["line_id"],
-            "policy_number": stmt["policy_number"],
-            "carrier_name": stmt["carrier_name"],
-            "expected": round(expected, 2),
-            "on_statement": round(on_statement, 2),
-            "cash_received": round(cash_received, 2),
-            "accrued": round(accrued, 2),
+            "line_id": line_id,
+            "policy_number": policy_number,
+            "carrier_name": carrier,
+            "expected": expected_rounded,
+            "on_statement": on_statement_rounded,
+            "cash_received": cash_rounded,
+            "accrued": accrued_rounded,
             "true_up_variance": round(true_up, 2),
             "status": status,
-            "match_status": mr.get("status", "unknown"),
+            "match_status": match_status,
         })
 
-    # Carrier summary
-    carrier_agg: dict[str, dict] = {}
-    for e in accrual_entries:
-        c = e["carrier_name"]
-        if c not in carrier_agg:
-            carrier_agg[c] = {"expected": 0, "on_statement": 0, "cash_received": 0, "accrued": 0, "lines": 0, "settled": 0}
-        b = carrier_agg[c]
-        b["expected"] += e["expected"]
-        b["on_statement"] += e["on_statement"]
-        b["cash_received"] += e["cash_received"]
-        b["accrued"] += max(e["accrued"], 0)
+        b = carrier_agg[carrier]
+        b["expected"] += expected_rounded
+        b["on_statement"] += on_statement_rounded
+        b["cash_received"] += cash_rounded
+        b["accrued"] += max(accrued_rounded, 0)
         b["lines"] += 1
-        if e["status"] == "settled":
+        if status == "settled":
             b["settled"] += 1
 
     by_carrier = [
@@ -596,11 +1098,11 @@ def api_accruals() -> JSONResponse:
         for k, v in sorted(carrier_agg.items())
     ]
 
-    return JSONResponse({
+    return {
         "totals": {k: round(v, 2) for k, v in totals.items()},
         "entries": accrual_entries,
         "by_carrier": by_carrier,
-    })
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -608,207 +1110,168 @@ def api_accruals() -> JSONResponse:
 # ---------------------------------------------------------------------------
 
 @app.get("/api/v1/demo/journal")
-def api_journal() -> JSONResponse:
+def api_journal() -> ORJSONResponse:
     """Generate journal entries from resolved matches + accruals."""
-    stmt_rows = _read_csv(DATA_DIR / "raw/statements/statement_lines.csv")
-    bank_rows = _read_csv(DATA_DIR / "raw/bank/bank_feed.csv")
-    bank_lookup = {r["bank_txn_id"]: float(r.get("amount", 0)) for r in bank_rows}
-
-    from app.persistence import latest_run_id, get_conn
-    run_id = latest_run_id(DB_PATH)
-    match_map: dict[str, dict] = {}
-    if run_id:
-        with get_conn(DB_PATH) as conn:
-            rows = conn.execute(
-                """SELECT line_id, matched_bank_txn_id, status
-                   FROM match_results WHERE run_id = ?""",
-                (run_id,),
-            ).fetchall()
-            match_map = {r["line_id"]: dict(r) for r in rows}
-
-    stmt_lookup = {r["line_id"]: r for r in stmt_rows}
-    journal_entries = []
-    je_id = 1
-
-    for stmt in stmt_rows:
-        mr = match_map.get(stmt["line_id"], {})
-        commission = float(stmt.get("gross_commission", 0))
-        cash = 0.0
-        if mr.get("matched_bank_txn_id"):
-            cash = bank_lookup.get(mr["matched_bank_txn_id"], 0.0)
-
-        is_settled = mr.get("status") in ("auto_matched", "resolved") and abs(cash) > 0.01
-
-        if is_settled:
-            # Cash receipt + revenue recognition
-            journal_entries.append({
-                "je_id": f"JE-{je_id:05d}",
-                "line_id": stmt["line_id"],
-                "carrier": stmt["carrier_name"],
-                "type": "cash_receipt",
-                "debit_account": "1010 — Cash",
-                "credit_account": "4010 — Commission Revenue",
-                "amount": round(abs(cash), 2),
-                "status": "posted",
-                "description": f"Cash receipt {stmt['policy_number']}",
-            })
-            je_id += 1
+    return ORJSONResponse(_compute_journal())
+
 
+# (type, debit account, credit account, status, description prefix)
+_JE_CASH_RECEIPT = ("cash_receipt", "1010 — Cash", "4010 — Commission Revenue", "posted", "Cash receipt")
+_JE_VARIANCE_SHORT = ("variance", "1310 — Commission Suspense", "4010 — Commission Revenue", "posted", "Variance adjustment")
+_JE_VARIANCE_OVER = ("variance", "4010 — Commission Revenue", "1310 — Commission Suspense", "posted", "Variance adjustment")
+_JE_CLAWBACK = ("clawback", "4010 — Commission Revenue", "1200 — Accounts Receivable", "pending_review", "Clawback")
+_JE_ACCRUAL = ("accrual", "1200 — Accounts Receivable", "4010 — Commission Revenue", "accrued", "Accrual")
+
+
+def _compute_journal() -> dict[str, Any]:
+    """Journal payload for the latest run, memoized like _compute_accruals."""
+    return _journal_cached(
+        _match_state(),
+        _csv_key(STATEMENT_LINES_CSV), _csv_key(EXPECTED_CSV), _csv_key(BANK_FEED_CSV),
+    )
+
+
+@lru_cache(maxsize=4)
+def _journal_cached(
+    state: MatchState, stmt_key: CsvKey | None, expected_key: CsvKey | None, bank_key: CsvKey | None,
+) -> dict[str, Any]:
+    cols = _statement_columns_cached(stmt_key, expected_key)
+    match_statuses, matched_cash = _line_match_columns_cached(state, stmt_key, expected_key, bank_key)
+
+    # Receipt amount and statement-vs-cash variance per line, computed column-wise
+    # up front. A receipt of 0.0 means the line is not settled and gets a clawback
+    # or accrual entry instead.
+    receipts = [
+        round(abs(cash), 2) if status in ("auto_matched", "resolved") and abs(cash) > 0.01 else 0.0
+        for status, cash in zip(match_statuses, matched_cash)
+    ]
+    variances = [
+        round(abs(commission) - abs(cash), 2) if receipt else 0.0
+        for commission, cash, receipt in zip(cols.statement, matched_cash, receipts)
+    ]
+
+    journal_entries: list[dict[str, Any]] = []
+    type_counts: Counter[str] = Counter()
+    totals = {"posted": 0.0, "accrued": 0.0, "pending_review": 0.0}
+
+    def add(template: tuple[str, ...], line_id: str, carrier: str, policy_number: str, amount: float) -> None:
+        je_type, debit, credit, status, description = template
+        journal_entries.append({
+            "je_id": f"JE-{len(journal_entries) + 1:05d}",
+            "line_id": line_id,
+            "carrier": carrier,
+            "type": je_type,
+            "debit_account": debit,
+            "credit_account": credit,
+            "amount": amount,
+            "status": status,
+            "description": f"{description} {policy_number}",
+        })
+        type_counts[je_type] += 1
+        totals[status] += amount
+
+    for line_id, policy_number, carrier, commission, commission_rounded, receipt, diff in zip(
+        cols.line_id, cols.policy_number, cols.carrier, cols.statement,
+        cols.statement_rounded, receipts, variances,
+    ):
+        if receipt:
+            add(_JE_CASH_RECEIPT, line_id, carrier, policy_number, receipt)
             # If there's a difference, book to suspense
-            diff = round(abs(commission) - abs(cash), 2)
             if abs(diff) > 0.01:
-                journal_entries.append({
-                    "je_id": f"JE-{je_id:05d}",
-                    "line_id": stmt["line_id"],
-                    "carrier": stmt["carrier_name"],
-                    "type": "variance",
-                    "debit_account": "1310 — Commission Suspense" if diff > 0 else "4010 — Commission Revenue",
-                    "credit_account": "4010 — Commission Revenue" if diff > 0 else "1310 — Commission Suspense",
-                    "amount": round(abs(diff), 2),
-                    "status": "posted",
-                    "description": f"Variance adjustment {stmt['policy_number']}",
-                })
-                je_id += 1
+                add(_JE_VARIANCE_SHORT if diff > 0 else _JE_VARIANCE_OVER,
+                    line_id, carrier, policy_number, abs(diff))
         elif commission < 0:
-            # Clawback reversal
-            journal_entries.append({
-                "je_id": f"JE-{je_id:05d}",
-                "line_id": stmt["line_id"],
-                "carrier": stmt["carrier_name"],
-                "type": "clawback",
-                "debit_account": "4010 — Commission Revenue",
-                "credit_account": "1200 — Accounts Receivable",
-                "amount": round(abs(commission), 2),
-                "status": "pending_review",
-                "description": f"Clawback {stmt['policy_number']}",
-            })
-            je_id += 1
+            add(_JE_CLAWBACK, line_id, carrier, policy_number, abs(commission_rounded))
         else:
-            # Accrual for unmatched/pending
-            journal_entries.append({
-                "je_id": f"JE-{je_id:05d}",
-                "line_id": stmt["line_id"],
-                "carrier": stmt["carrier_name"],
-                "type": "accrual",
-                "debit_account": "1200 — Accounts Receivable",
-                "credit_account": "4010 — Commission Revenue",
-                "amount": round(abs(commission), 2),
-                "status": "accrued",
-                "description": f"Accrual {stmt['policy_number']}",
-            })
-            je_id += 1
+            add(_JE_ACCRUAL, line_id, carrier, policy_number, abs(commission_rounded))
 
-    # Summarize
-    type_counts = Counter(e["type"] for e in journal_entries)
-    total_posted = sum(e["amount"] for e in journal_entries if e["status"] == "posted")
-    total_accrued = sum(e["amount"] for e in journal_entries if e["status"] == "accrued")
-    total_pending = sum(e["amount"] for e in journal_entries if e["status"] == "pending_review")
-
-    return JSONResponse({
+    return {
         "entries": journal_entries,
         "count": len(journal_entries),
         "type_counts": dict(type_counts),
-        "totals": {
-            "posted": round(total_posted, 2),
-            "accrued": round(total_accrued, 2),
-            "pending_review": round(total_pending, 2),
-        },
-    })
+        "totals": {status: round(total, 2) for status, total in totals.items()},
+    }
 
 
 @app.post("/api/v1/demo/journal/post")
-def api_journal_post() -> JSONResponse:
+def api_journal_post() -> ORJSONResponse:
     """Simulate posting journal entries to GL."""
-    log_audit_event(
+    audit_log.log(
         DB_PATH, event_type="gl_posting", action="posted",
         entity_type="journal", entity_id="batch",
         actor="analyst", detail="Batch GL posting simulated",
     )
-    return JSONResponse({"ok": True, "message": "Journal entries posted to GL (simulated)"})
+    return ORJSONResponse({"ok": True, "message": "Journal entries posted to GL (simulated)"})
 
 
 # ---------------------------------------------------------------------------
 # Export endpoints
 # ---------------------------------------------------------------------------
 
-@app.get("/api/v1/demo/exports/accrual.csv")
-def api_export_accrual():
-    """Export accrual entries as CSV."""
-    import io
-    accrual_data = api_accruals().body
-    import json
-    data = json.loads(accrual_data)
-    entries = data["entries"]
-
-    output = io.StringIO()
-    if entries:
-        fieldnames = list(entries[0].keys())
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-        for e in entries:
-            writer.writerow(e)
-
-    log_audit_event(DB_PATH, event_type="export", action="downloaded",
-                    entity_type="export", entity_id="accrual.csv", actor="analyst")
-
-    from starlette.responses import Response
-    return Response(
-        content=output.getvalue(),
+CSV_CHUNK_ROWS = 500
+
+
+def _csv_download(entries: Iterable[dict[str, Any]], filename: str) -> StreamingResponse:
+    """Stream entries as a CSV attachment, flushing every CSV_CHUNK_ROWS rows.
+
+    ``entries`` is consumed lazily, so a generator is never materialized in full.
+    """
+    def generate() -> Iterator[str]:
+        rows = iter(entries)
+        first = next(rows, None)
+        if first is None:
+            return
+        fieldnames = list(first.keys())
+        # Export entries always carry several columns, so the getter yields a tuple per row
+        row_values = itemgetter(*fieldnames)
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        writer.writerow(fieldnames)
+        chunk = [first, *islice(rows, CSV_CHUNK_ROWS - 1)]
+        while chunk:
+            writer.writerows(map(row_values, chunk))
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate()
+            chunk = list(islice(rows, CSV_CHUNK_ROWS))
+
+    return StreamingResponse(
+        generate(),
         media_type="text/csv",
-        headers={"Content-Disposition": 'attachment; filename="accrual.csv"'},
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            # Let proxies pass chunks through as they are produced
+            "X-Accel-Buffering": "no",
+            "Cache-Control": "no-cache",
+        },
     )
 
 
+@app.get("/api/v1/demo/exports/accrual.csv")
+def api_export_accrual() -> StreamingResponse:
+    """Export accrual entries as CSV."""
+    entries = _compute_accruals()["entries"]
+    audit_log.log(DB_PATH, event_type="export", action="downloaded",
+                  entity_type="export", entity_id="accrual.csv", actor="analyst")
+    return _csv_download(entries, "accrual.csv")
+
+
 @app.get("/api/v1/demo/exports/journal.csv")
-def api_export_journal():
+def api_export_journal() -> StreamingResponse:
     """Export journal entries as CSV."""
-    import io, json
-    journal_data = json.loads(api_journal().body)
-    entries = journal_data["entries"]
-
-    output = io.StringIO()
-    if entries:
-        fieldnames = list(entries[0].keys())
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-        for e in entries:
-            writer.writerow(e)
-
-    log_audit_event(DB_PATH, event_type="export", action="downloaded",
-                    entity_type="export", entity_id="journal.csv", actor="analyst")
-
-    from starlette.responses import Response
-    return Response(
-        content=output.getvalue(),
-        media_type="text/csv",
-        headers={"Content-Disposition": 'attachment; filename="journal.csv"'},
-    )
+    entries = _compute_journal()["entries"]
+    audit_log.log(DB_PATH, event_type="export", action="downloaded",
+                  entity_type="export", entity_id="journal.csv", actor="analyst")
+    return _csv_download(entries, "journal.csv")
 
 
 @app.get("/api/v1/demo/exports/producer-payout.csv")
-def api_export_producer_payout():
+def api_export_producer_payout() -> StreamingResponse:
     """Export producer payout summary as CSV."""
-    import io, json
-    producer_data = json.loads(api_producers().body)
-    entries = producer_data["producers"]
-
-    output = io.StringIO()
-    if entries:
-        fieldnames = list(entries[0].keys())
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-        for e in entries:
-            writer.writerow(e)
-
-    log_audit_event(DB_PATH, event_type="export", action="downloaded",
-                    entity_type="export", entity_id="producer-payout.csv", actor="analyst")
-
-    from starlette.responses import Response
-    return Response(
-        content=output.getvalue(),
-        media_type="text/csv",
-        headers={"Content-Disposition": 'attachment; filename="producer-payout.csv"'},
-    )
+    entries = _compute_producers()["producers"]
+    audit_log.log(DB_PATH, event_type="export", action="downloaded",
+                  entity_type="export", entity_id="producer-payout.csv", actor="analyst")
+    return _csv_download(entries, "producer-payout.csv")
 
 
 # ---------------------------------------------------------------------------
@@ -816,76 +1279,54 @@ def api_export_producer_payout():
 # ---------------------------------------------------------------------------
 
 @app.get("/api/v1/demo/producers")
-def api_producers() -> JSONResponse:
+def api_producers() -> ORJSONResponse:
     """Producer compensation summary: commission by producer, carrier, LOB."""
-    stmt_rows = _read_csv(DATA_DIR / "raw/statements/statement_lines.csv")
-    expected_rows = _read_csv(DATA_DIR / "expected/ams_expected.csv")
-
-    from app.persistence import latest_run_id, get_conn
-    run_id = latest_run_id(DB_PATH)
-    match_map: dict[str, str] = {}
-    if run_id:
-        with get_conn(DB_PATH) as conn:
-            rows = conn.execute(
-                "SELECT line_id, status FROM match_results WHERE run_id = ?",
-                (run_id,),
-            ).fetchall()
-            match_map = {r["line_id"]: r["status"] for r in rows}
+    return ORJSONResponse(_compute_producers())
 
-    producer_agg: dict[str, dict] = {}
-    for i, stmt in enumerate(stmt_rows):
-        ams = expected_rows[i] if i < len(expected_rows) else {}
-        producer_id = ams.get("producer_id", "Unknown")
-        office = ams.get("office", "")
-        lob = ams.get("lob", "Unknown")
-        commission = float(stmt.get("gross_commission", 0))
-        expected = float(ams.get("expected_commission", 0))
-        status = match_map.get(stmt["line_id"], "unknown")
-
-        if producer_id not in producer_agg:
-            producer_agg[producer_id] = {
-                "producer_id": producer_id,
-                "office": office,
-                "total_commission": 0.0,
-                "total_expected": 0.0,
-                "matched_commission": 0.0,
-                "pending_commission": 0.0,
-                "clawbacks": 0.0,
-                "lines": 0,
-                "matched_lines": 0,
-                "carriers": set(),
-                "lobs": set(),
-            }
-        p = producer_agg[producer_id]
-        p["total_commission"] += commission
-        p["total_expected"] += expected
-        p["lines"] += 1
-        p["carriers"].add(stmt["carrier_name"])
-        p["lobs"].add(lob)
-        if stmt.get("txn_type") == "clawback":
-            p["clawbacks"] += commission
+
+def _compute_producers() -> dict[str, Any]:
+    """Producer payload for the latest run, memoized on the run and input CSV versions.
+
+    The payload is shared between the JSON endpoint and the CSV export; don't mutate it.
+    """
+    return _producers_cached(_match_state(), _csv_key(STATEMENT_LINES_CSV), _csv_key(EXPECTED_CSV))
+
+
+@lru_cache(maxsize=4)
+def _producers_cached(state: MatchState, stmt_key: CsvKey | None, expected_key: CsvKey | None) -> dict[str, Any]:
+    csv_keys = (stmt_key, expected_key)
+    cols = _statement_columns_cached(*csv_keys)
+    statuses = _line_statuses_cached(state, *csv_keys)
+
+    matched_commission: defaultdict[str, float] = defaultdict(float)
+    pending_commission: defaultdict[str, float] = defaultdict(float)
+    matched_lines: Counter[str] = Counter()
+    for status, producer_id, commission in zip(statuses, cols.producer_id, cols.statement):
         if status in ("auto_matched", "resolved"):
-            p["matched_commission"] += commission
-            p["matched_lines"] += 1
+            matched_commission[producer_id] += commission
+            matched_lines[producer_id] += 1
         else:
-            p["pending_commission"] += commission
+            pending_commission[producer_id] += commission
 
+    baseline = _producer_baseline_cached(*csv_keys)
     producers = []
-    for p in sorted(producer_agg.values(), key=lambda x: x["total_commission"], reverse=True):
+    for p in sorted(baseline.values(), key=lambda x: x["total_commission"], reverse=True):
+        pid = p["producer_id"]
+        matched = matched_commission.get(pid, 0.0)
         producers.append({
-            "producer_id": p["producer_id"],
+            "producer_id": pid,
             "office": p["office"],
             "total_commission": round(p["total_commission"], 2),
             "total_expected": round(p["total_expected"], 2),
-            "matched_commission": round(p["matched_commission"], 2),
-            "pending_commission": round(p["pending_commission"], 2),
+            "matched_commission": round(matched, 2),
+            "pending_commission": round(pending_commission.get(pid, 0.0), 2),
             "clawbacks": round(p["clawbacks"], 2),
-            "net_payout": round(p["matched_commission"] + p["clawbacks"], 2),
+            "net_payout": round(matched + p["clawbacks"], 2),
             "lines": p["lines"],
-            "matched_lines": p["matched_lines"],
-            "match_rate": round(p["matched_lines"] / p["lines"] * 100, 1) if p["lines"] else 0,
-            "carriers": sorted(p["carriers"]),
-            "lobs": sorted(p["lobs"]),
+            "matched_lines": matched_lines[pid],
+            "match_rate": round(matched_lines[pid] / p["lines"] * 100, 1) if p["lines"] else 0,
+            "carriers": list(p["carriers"]),
+            "lobs": list(p["lobs"]),
         })
 
     totals = {
@@ -897,7 +1338,7 @@ def api_producers() -> JSONResponse:
         "producers": len(producers),
     }
 
-    return JSONResponse({"producers": producers, "totals": totals})
+    return {"producers": producers, "totals": totals}
 
 
 # ---------------------------------------------------------------------------
@@ -905,13 +1346,13 @@ def api_producers() -> JSONResponse:
 # ---------------------------------------------------------------------------
 
 @app.get("/api/v1/demo/splits")
-def api_list_splits(producer_id: str | None = None) -> JSONResponse:
+def api_list_splits(producer_id: str | None = None) -> ORJSONResponse:
     rows = list_split_rules(DB_PATH, producer_id=producer_id)
-    return JSONResponse({"rows": rows, "count": len(rows)})
+    return ORJSONResponse({"rows": rows, "count": len(rows)})
 
 
 @app.post("/api/v1/demo/splits")
-def api_upsert_split(payload: UpsertSplitRuleRequest) -> JSONResponse:
+def api_upsert_split(payload: UpsertSplitRuleRequest) -> ORJSONResponse:
     row = upsert_split_rule(
         DB_PATH,
         producer_id=payload.producer_id,
@@ -925,52 +1366,49 @@ def api_upsert_split(payload: UpsertSplitRuleRequest) -> JSONResponse:
         effective_to=payload.effective_to,
         note=payload.note,
     )
-    log_audit_event(
+    audit_log.log(
         DB_PATH, event_type="split_rule", action="upsert",
         entity_type="split_rule", entity_id=payload.producer_id, actor="analyst",
         detail=f"{payload.producer_id}: {payload.split_pct}% producer / {payload.house_pct}% house",
         new_value=f"{payload.split_pct}/{payload.house_pct}",
     )
-    return JSONResponse({"ok": True, "rule": row})
+    return ORJSONResponse({"ok": True, "rule": row})
 
 
 @app.delete("/api/v1/demo/splits/{rule_id}")
-def api_delete_split(rule_id: int) -> JSONResponse:
+def api_delete_split(rule_id: int) -> ORJSONResponse:
     ok = delete_split_rule(DB_PATH, rule_id)
     if not ok:
         raise HTTPException(status_code=404, detail="Rule not found")
-    log_audit_event(
+    audit_log.log(
         DB_PATH, event_type="split_rule", action="deleted",
         entity_type="split_rule", entity_id=str(rule_id), actor="analyst",
     )
-    return JSONResponse({"ok": True})
+    return ORJSONResponse({"ok": True})
 
 
 @app.post("/api/v1/demo/splits/seed")
-def api_seed_splits() -> JSONResponse:
+def api_seed_splits() -> ORJSONResponse:
     """Seed demo split rules for all producers."""
-    import random
-    expected_rows = _read_csv(DATA_DIR / "expected/ams_expected.csv")
-    producers = sorted(set(r.get("producer_id", "") for r in expected_rows if r.get("producer_id")))
+    producers = _producer_ids()
 
-    seeded = 0
+    rules: list[dict[str, Any]] = []
     for pid in producers:
         # Default split: producer gets 60-85%, house gets the rest
         split = random.choice([60, 65, 70, 75, 80, 85])
-        upsert_split_rule(DB_PATH, producer_id=pid, split_pct=float(split), house_pct=float(100 - split),
-                          note="Default split (seeded)")
-        seeded += 1
+        rules.append({"producer_id": pid, "split_pct": float(split), "house_pct": float(100 - split),
+                      "note": "Default split (seeded)"})
 
         # Some producers get carrier-specific overrides
         if random.random() < 0.4:
             carrier = random.choice(["Summit National", "Wilson Mutual", "Northfield Specialty"])
             override_split = random.choice([55, 60, 65, 70, 90])
-            upsert_split_rule(DB_PATH, producer_id=pid, split_pct=float(override_split),
-                              house_pct=float(100 - override_split), carrier=carrier,
-                              note=f"Carrier override for {carrier} (seeded)")
-            seeded += 1
+            rules.append({"producer_id": pid, "split_pct": float(override_split),
+                          "house_pct": float(100 - override_split), "carrier": carrier,
+                          "note": f"Carrier override for {carrier} (seeded)"})
 
-    return JSONResponse({"ok": True, "seeded": seeded})
+    seeded = upsert_split_rules(DB_PATH, rules)
+    return ORJSONResponse({"ok": True, "seeded": seeded})
 
 
 # ---------------------------------------------------------------------------
@@ -978,13 +1416,13 @@ def api_seed_splits() -> JSONResponse:
 # ---------------------------------------------------------------------------
 
 @app.get("/api/v1/demo/adjustments")
-def api_list_adjustments(producer_id: str | None = None) -> JSONResponse:
+def api_list_adjustments(producer_id: str | None = None) -> ORJSONResponse:
     rows = list_adjustments(DB_PATH, producer_id=producer_id)
-    return JSONResponse({"rows": rows, "count": len(rows)})
+    return ORJSONResponse({"rows": rows, "count": len(rows)})
 
 
 @app.post("/api/v1/demo/adjustments")
-def api_create_adjustment(payload: CreateAdjustmentRequest) -> JSONResponse:
+def api_create_adjustment(payload: CreateAdjustmentRequest) -> ORJSONResponse:
     row = create_adjustment(
         DB_PATH,
         producer_id=payload.producer_id,
@@ -993,22 +1431,19 @@ def api_create_adjustment(payload: CreateAdjustmentRequest) -> JSONResponse:
         description=payload.description,
         period=payload.period,
     )
-    log_audit_event(
+    audit_log.log(
         DB_PATH, event_type="adjustment", action="created",
         entity_type="adjustment", entity_id=payload.producer_id, actor="analyst",
         detail=f"{payload.adj_type}: ${payload.amount:.2f} for {payload.producer_id}",
     )
-    return JSONResponse({"ok": True, "adjustment": row})
+    return ORJSONResponse({"ok": True, "adjustment": row})
 
 
 @app.post("/api/v1/demo/adjustments/seed")
-def api_seed_adjustments() -> JSONResponse:
+def api_seed_adjustments() -> ORJSONResponse:
     """Seed demo adjustments: clawback offsets, chargebacks, draws."""
-    import random
-    expected_rows = _read_csv(DATA_DIR / "expected/ams_expected.csv")
-    producers = sorted(set(r.get("producer_id", "") for r in expected_rows if r.get("producer_id")))
+    producers = _producer_ids()
 
-    seeded = 0
     adj_types = [
         ("clawback_offset", -200, -50, "Clawback offset from carrier reversal"),
         ("chargeback", -500, -100, "E&O chargeback"),
@@ -1017,93 +1452,80 @@ def api_seed_adjustments() -> JSONResponse:
         ("bonus", 500, 2000, "Quarterly production bonus"),
     ]
 
+    adjustments: list[dict[str, Any]] = []
     for pid in producers:
         # Each producer gets 1-3 adjustments
         for _ in range(random.randint(1, 3)):
             adj_type, lo, hi, desc = random.choice(adj_types)
             amount = round(random.uniform(lo, hi), 2)
-            create_adjustment(DB_PATH, producer_id=pid, adj_type=adj_type,
-                              amount=amount, description=desc, period="2026-01")
-            seeded += 1
+            adjustments.append({"producer_id": pid, "adj_type": adj_type,
+                                "amount": amount, "description": desc, "period": "2026-01"})
 
-    return JSONResponse({"ok": True, "seeded": seeded})
+    seeded = create_adjustments(DB_PATH, adjustments)
+    return ORJSONResponse({"ok": True, "seeded": seeded})
 
 
 @app.get("/api/v1/demo/netting")
-def api_netting() -> JSONResponse:
+def api_netting() -> ORJSONResponse:
     """Net position per producer: gross commission - clawbacks - adjustments = net payout."""
-    stmt_rows = _read_csv(DATA_DIR / "raw/statements/statement_lines.csv")
-    expected_rows = _read_csv(DATA_DIR / "expected/ams_expected.csv")
+    return ORJSONResponse(_compute_netting())
+
+
+def _new_netting_shares() -> dict[str, float]:
+    return {"matched_commission": 0.0, "producer_share": 0.0, "house_share": 0.0}
+
+
+def _compute_netting() -> dict[str, Any]:
+    csv_keys = (_csv_key(STATEMENT_LINES_CSV), _csv_key(EXPECTED_CSV))
+    cols = _statement_columns_cached(*csv_keys)
     adjustments = list_adjustments(DB_PATH)
     splits = list_split_rules(DB_PATH)
 
-    from app.persistence import latest_run_id, get_conn
-    run_id = latest_run_id(DB_PATH)
-    match_map: dict[str, str] = {}
-    if run_id:
-        with get_conn(DB_PATH) as conn:
-            rows = conn.execute(
-                "SELECT line_id, status FROM match_results WHERE run_id = ?", (run_id,),
-            ).fetchall()
-            match_map = {r["line_id"]: r["status"] for r in rows}
-
-    # Build split lookup: (producer, carrier) → split_pct, default (producer, None) → split_pct
-    split_lookup: dict[tuple[str, str | None], float] = {}
-    for s in splits:
-        key = (s["producer_id"], s.get("carrier"))
-        split_lookup[key] = s["split_pct"]
+    statuses = _line_statuses_cached(_match_state(), *csv_keys)
 
-    # Aggregate by producer
-    producer_agg: dict[str, dict] = {}
-    for i, stmt in enumerate(stmt_rows):
-        ams = expected_rows[i] if i < len(expected_rows) else {}
-        pid = ams.get("producer_id", "Unknown")
-        commission = float(stmt.get("gross_commission", 0))
-        status = match_map.get(stmt["line_id"], "unknown")
-        carrier = stmt.get("carrier_name", "")
-
-        if pid not in producer_agg:
-            producer_agg[pid] = {
-                "producer_id": pid,
-                "gross_commission": 0.0,
-                "clawbacks": 0.0,
-                "matched_commission": 0.0,
-                "producer_share": 0.0,
-                "house_share": 0.0,
-                "adjustments_total": 0.0,
-                "net_payout": 0.0,
-                "lines": 0,
-            }
-        p = producer_agg[pid]
-        p["gross_commission"] += commission
-        p["lines"] += 1
-
-        if stmt.get("txn_type") == "clawback":
-            p["clawbacks"] += commission
+    # Build split lookup: producer → carrier → split_pct, with the producer default under None
+    split_lookup: dict[str, dict[str | None, float]] = {}
+    for s in splits:
+        split_lookup.setdefault(s["producer_id"], {})[s.get("carrier")] = s["split_pct"]
 
+    # Split matched commission between producer and house
+    shares: defaultdict[str, dict[str, float]] = defaultdict(_new_netting_shares)
+    for status, pid, carrier, commission in zip(
+        statuses, cols.producer_id, cols.carrier, cols.statement,
+    ):
         if status in ("auto_matched", "resolved"):
-            p["matched_commission"] += commission
-            # Apply split
-            split_pct = split_lookup.get((pid, carrier), split_lookup.get((pid, None), 100.0))
-            p["producer_share"] += commission * split_pct / 100.0
-            p["house_share"] += commission * (100.0 - split_pct) / 100.0
-
-    # Apply adjustments
+            sh = shares[pid]
+            sh["matched_commission"] += commission
+            rules = split_lookup.get(pid)
+            split_pct = rules.get(carrier, rules.get(None, 100.0)) if rules else 100.0
+            sh["producer_share"] += commission * split_pct / 100.0
+            sh["house_share"] += commission * (100.0 - split_pct) / 100.0
+
+    # Group adjustments by producer, keeping running totals alongside
     adj_by_producer: dict[str, list] = {}
+    adj_totals: dict[str, float] = {}
     for adj in adjustments:
-        adj_by_producer.setdefault(adj["producer_id"], []).append(adj)
-
-    for pid, p in producer_agg.items():
-        adjs = adj_by_producer.get(pid, [])
-        adj_total = sum(a["amount"] for a in adjs)
-        p["adjustments_total"] = round(adj_total, 2)
-        p["net_payout"] = round(p["producer_share"] + adj_total, 2)
-        p["producer_share"] = round(p["producer_share"], 2)
-        p["house_share"] = round(p["house_share"], 2)
-        p["gross_commission"] = round(p["gross_commission"], 2)
-        p["clawbacks"] = round(p["clawbacks"], 2)
-        p["matched_commission"] = round(p["matched_commission"], 2)
-        p["adjustment_details"] = adjs
+        pid = adj["producer_id"]
+        adj_by_producer.setdefault(pid, []).append(adj)
+        adj_totals[pid] = adj_totals.get(pid, 0) + adj["amount"]
+
+    # One pass per producer: gross and clawbacks don't depend on match status
+    producer_agg: dict[str, dict] = {}
+    for pid, base in _producer_baseline_cached(*csv_keys).items():
+        sh = shares.get(pid) or _new_netting_shares()
+        adj_total = adj_totals.get(pid, 0)
+        producer_agg[pid] = {
+            "producer_id": pid,
+            "gross_commission": round(base["total_commission"], 2),
+            "clawbacks": round(base["clawbacks"], 2),
+            "matched_commission": round(sh["matched_commission"], 2),
+            "producer_share": round(sh["producer_share"], 2),
+            "house_share": round(sh["house_share"], 2),
+            "adjustments_total": round(adj_total, 2),
+            "net_payout": round(sh["producer_share"] + adj_total, 2),
+            "lines": base["lines"],
+            "adjustment_details": adj_by_producer.get(pid, []),
+        }
 
     producers = sorted(producer_agg.values(), key=lambda x: x["gross_commission"], reverse=True)
 
@@ -1116,7 +1538,7 @@ def api_netting() -> JSONResponse:
         "net_payout": round(sum(p["net_payout"] for p in producers), 2),
     }
 
-    return JSONResponse({"producers": producers, "totals": totals})
+    return {"producers": producers, "totals": totals}
 
 
 # ---------------------------------------------------------------------------
@@ -1124,57 +1546,45 @@ def api_netting() -> JSONResponse:
 # ---------------------------------------------------------------------------
 
 @app.get("/api/v1/demo/rule-versions")
-def api_rule_versions(rule_type: str | None = None, rule_id: str | None = None) -> JSONResponse:
+def api_rule_versions(rule_type: str | None = None, rule_id: str | None = None) -> ORJSONResponse:
     rows = list_rule_versions(DB_PATH, rule_type=rule_type, rule_id=rule_id)
-    return JSONResponse({"rows": rows, "count": len(rows)})
+    return ORJSONResponse({"rows": rows, "count": len(rows)})
 
 
 @app.post("/api/v1/demo/rules/test")
-def api_test_rule_change(payload: UpsertSplitRuleRequest) -> JSONResponse:
+def api_test_rule_change(payload: UpsertSplitRuleRequest) -> ORJSONResponse:
     """Test harness: simulate what would change if this split rule were applied to last month's results."""
-    stmt_rows = _read_csv(DATA_DIR / "raw/statements/statement_lines.csv")
-    expected_rows = _read_csv(DATA_DIR / "expected/ams_expected.csv")
-
-    from app.persistence import latest_run_id, get_conn
-    run_id = latest_run_id(DB_PATH)
-    match_map: dict[str, str] = {}
-    if run_id:
-        with get_conn(DB_PATH) as conn:
-            rows = conn.execute(
-                "SELECT line_id, status FROM match_results WHERE run_id = ?", (run_id,),
-            ).fetchall()
-            match_map = {r["line_id"]: r["status"] for r in rows}
+    csv_keys = (_csv_key(STATEMENT_LINES_CSV), _csv_key(EXPECTED_CSV))
+    cols = _statement_columns_cached(*csv_keys)
+
+    statuses = _line_statuses_cached(_match_state(), *csv_keys)
 
     # Current splits
     current_splits = list_split_rules(DB_PATH, producer_id=payload.producer_id)
     current_default = next((s["split_pct"] for s in current_splits
                             if not s.get("carrier") and not s.get("lob")), 100.0)
+    carrier_pct: dict[str | None, float] = {}
+    for s in current_splits:
+        carrier_pct.setdefault(s.get("carrier"), s["split_pct"])
 
     # Calculate current vs proposed
     affected_lines = []
     total_current = 0.0
     total_proposed = 0.0
 
-    for i, stmt in enumerate(stmt_rows):
-        ams = expected_rows[i] if i < len(expected_rows) else {}
-        if ams.get("producer_id") != payload.producer_id:
-            continue
-        status = match_map.get(stmt["line_id"], "unknown")
+    for i in _producer_lines_cached(*csv_keys).get(payload.producer_id, ()):
+        line_id = cols.line_id[i]
+        status = statuses[i]
         if status not in ("auto_matched", "resolved"):
             continue
 
-        commission = float(stmt.get("gross_commission", 0))
-        carrier = stmt.get("carrier_name", "")
+        carrier, commission = cols.carrier[i], cols.statement[i]
 
         # Should this line be affected by the proposed rule?
         matches_carrier = not payload.carrier or payload.carrier == carrier
-        matches_lob = not payload.lob or payload.lob == ams.get("lob", "")
+        matches_lob = not payload.lob or payload.lob == cols.lob[i]
 
-        current_pct = current_default
-        for s in current_splits:
-            if s.get("carrier") == carrier:
-                current_pct = s["split_pct"]
-                break
+        current_pct = carrier_pct.get(carrier, current_default)
 
         if matches_carrier and matches_lob:
             proposed_pct = payload.split_pct
@@ -1188,8 +1598,8 @@ def api_test_rule_change(payload: UpsertSplitRuleRequest) -> JSONResponse:
 
         if abs(current_share - proposed_share) > 0.01:
             affected_lines.append({
-                "line_id": stmt["line_id"],
-                "policy_number": stmt["policy_number"],
+                "line_id": line_id,
+                "policy_number": cols.policy_number[i],
                 "carrier": carrier,
                 "commission": round(commission, 2),
                 "current_pct": current_pct,
@@ -1199,7 +1609,7 @@ def api_test_rule_change(payload: UpsertSplitRuleRequest) -> JSONResponse:
                 "delta": round(proposed_share - current_share, 2),
             })
 
-    return JSONResponse({
+    return ORJSONResponse({
         "producer_id": payload.producer_id,
         "affected_lines": len(affected_lines),
         "current_total": round(total_current, 2),
@@ -1214,40 +1624,34 @@ def api_test_rule_change(payload: UpsertSplitRuleRequest) -> JSONResponse:
 # ---------------------------------------------------------------------------
 
 @app.post("/api/v1/demo/statements/upload")
-def api_upload_statement(carrier: str | None = None) -> JSONResponse:
+def api_upload_statement(carrier: str | None = None) -> ORJSONResponse:
     """Simulate statement upload + AI parsing. Returns pre-loaded lines for the carrier."""
-    stmt_rows = _read_csv(DATA_DIR / "raw/statements/statement_lines.csv")
+    statements_by_carrier = _statements_by_carrier()
 
     # Pick a carrier to simulate (default to first available or specified)
-    carriers = sorted(set(r["carrier_name"] for r in stmt_rows))
+    carriers = sorted(statements_by_carrier)
     if carrier and carrier in carriers:
         target_carrier = carrier
     else:
-        import random
         target_carrier = random.choice(carriers) if carriers else "Summit National"
 
-    # Get lines for one statement from this carrier
-    carrier_lines = [r for r in stmt_rows if r["carrier_name"] == target_carrier]
-    # Group by statement_id and pick one
-    grouped: dict[str, list] = {}
-    for r in carrier_lines:
-        grouped.setdefault(r["statement_id"], []).append(r)
+    # Pick one statement from this carrier
+    grouped = statements_by_carrier.get(target_carrier, {})
 
-    import random as rng
-    stmt_id = rng.choice(list(grouped.keys())) if grouped else ""
-    lines = grouped.get(stmt_id, [])
+    stmt_id = random.choice(list(grouped.keys())) if grouped else ""
+    lines = grouped.get(stmt_id, ())
 
     # Simulate extraction with confidence scores
     extracted = []
     for row in lines:
-        conf = rng.uniform(0.82, 0.99)
+        conf = random.uniform(0.82, 0.99)
         # Occasionally lower confidence for "hard to parse" fields
         field_confs = {
-            "policy_number": round(rng.uniform(0.85, 1.0), 2),
-            "insured_name": round(rng.uniform(0.70, 0.99), 2),
-            "written_premium": round(rng.uniform(0.90, 1.0), 2),
-            "gross_commission": round(rng.uniform(0.88, 1.0), 2),
-            "effective_date": round(rng.uniform(0.80, 1.0), 2),
+            "policy_number": round(random.uniform(0.85, 1.0), 2),
+            "insured_name": round(random.uniform(0.70, 0.99), 2),
+            "written_premium": round(random.uniform(0.90, 1.0), 2),
+            "gross_commission": round(random.uniform(0.88, 1.0), 2),
+            "effective_date": round(random.uniform(0.80, 1.0), 2),
         }
         extracted.append({
             **row,
@@ -1255,13 +1659,13 @@ def api_upload_statement(carrier: str | None = None) -> JSONResponse:
             "field_confidences": field_confs,
         })
 
-    log_audit_event(
+    audit_log.log(
         DB_PATH, event_type="statement_upload", action="parsed",
         entity_type="statement", entity_id=stmt_id, actor="analyst",
         detail=f"Uploaded {target_carrier} statement, extracted {len(extracted)} lines",
     )
 
-    return JSONResponse({
+    return ORJSONResponse({
         "ok": True,
         "carrier": target_carrier,
         "statement_id": stmt_id,
@@ -1276,62 +1680,46 @@ def api_upload_statement(carrier: str | None = None) -> JSONResponse:
 # ---------------------------------------------------------------------------
 
 @app.get("/api/v1/demo/aging")
-def api_aging() -> JSONResponse:
+def api_aging() -> ORJSONResponse:
     """Variance and aging analysis: unmatched by carrier, reason, and age buckets."""
-    from datetime import date
-
-    stmt_rows = _read_csv(DATA_DIR / "raw/statements/statement_lines.csv")
-    cases = read_case_manifest(DATA_DIR / "demo_cases/case_manifest.csv")
-    case_lookup = {c["line_id"]: c for c in cases}
-
-    from app.persistence import latest_run_id, get_conn
-    run_id = latest_run_id(DB_PATH)
-    match_map: dict[str, dict] = {}
-    if run_id:
-        with get_conn(DB_PATH) as conn:
-            rows = conn.execute(
-                """SELECT line_id, status, reason, confidence
-                   FROM match_results WHERE run_id = ?""",
-                (run_id,),
-            ).fetchall()
-            match_map = {r["line_id"]: dict(r) for r in rows}
+    return ORJSONResponse(_compute_aging())
+
+
+# Open items up to AGE_BUCKET_MAX_DAYS[i] days old fall in AGE_BUCKETS[i]; older ones in the last bucket.
+AGE_BUCKETS = ("0-7d", "8-30d", "31-60d", "60+d")
+AGE_BUCKET_MAX_DAYS = (7, 30, 60)
 
+
+def _compute_aging() -> dict[str, Any]:
+    stmt_key, expected_key = _csv_key(STATEMENT_LINES_CSV), _csv_key(EXPECTED_CSV)
+    stmt_rows = _rows_for(stmt_key)
+    cols = _statement_columns_cached(stmt_key, expected_key)
+    matches = _line_matches_cached(_match_state(), stmt_key, expected_key)
     today = date.today()
-    buckets = {"0-7d": 0, "8-30d": 0, "31-60d": 0, "60+d": 0}
-    bucket_amounts = {"0-7d": 0.0, "8-30d": 0.0, "31-60d": 0.0, "60+d": 0.0}
+    ages = _line_ages_cached(stmt_key, today)
+    age_buckets = _line_age_buckets_cached(stmt_key, today)
+    case_lookup = _index_csv(CASE_MANIFEST_CSV, "line_id")
+
+    buckets = dict.fromkeys(AGE_BUCKETS, 0)
+    bucket_amounts = dict.fromkeys(AGE_BUCKETS, 0.0)
     by_carrier: dict[str, dict] = {}
     by_reason: dict[str, dict] = {}
     open_items = []
 
-    for stmt in stmt_rows:
-        mr = match_map.get(stmt["line_id"], {})
+    # Filter and aggregate on the typed columns; the raw row is only read for open items
+    for stmt, mr, line_id, policy_number, carrier, gross_commission, age_days, bucket in zip(
+        stmt_rows, matches, cols.line_id, cols.policy_number, cols.carrier, cols.statement, ages, age_buckets,
+    ):
         status = mr.get("status", "unknown")
         if status in ("auto_matched", "resolved"):
             continue
 
-        commission = abs(float(stmt.get("gross_commission", 0)))
-        carrier = stmt["carrier_name"]
-        case = case_lookup.get(stmt["line_id"], {})
+        commission = abs(gross_commission)
+        case = case_lookup.get(line_id, {})
         reason = mr.get("reason", case.get("expected_reason", "unknown"))
         level = case.get("level", "L1")
         severity = case.get("severity", "low")
 
-        # Calculate age from txn_date
-        try:
-            txn_date = date.fromisoformat(stmt.get("txn_date", "")[:10])
-            age_days = (today - txn_date).days
-        except (ValueError, TypeError):
-            age_days = 0
-
-        if age_days <= 7:
-            bucket = "0-7d"
-        elif age_days <= 30:
-            bucket = "8-30d"
-        elif age_days <= 60:
-            bucket = "31-60d"
-        else:
-            bucket = "60+d"
-
         buckets[bucket] += 1
         bucket_amounts[bucket] += commission
 
@@ -1349,8 +1737,8 @@ def api_aging() -> JSONResponse:
         by_reason[base_reason]["amount"] += commission
 
         open_items.append({
-            "line_id": stmt["line_id"],
-            "policy_number": stmt["policy_number"],
+            "line_id": line_id,
+            "policy_number": policy_number,
             "carrier_name": carrier,
             "insured_name": stmt.get("insured_name", ""),
             "commission": round(commission, 2),
@@ -1367,7 +1755,7 @@ def api_aging() -> JSONResponse:
     # Sort by age descending
     open_items.sort(key=lambda x: x["age_days"], reverse=True)
 
-    return JSONResponse({
+    return {
         "total_open": len(open_items),
         "total_amount": round(sum(i["commission"] for i in open_items), 2),
         "buckets": {k: {"count": buckets[k], "amount": round(bucket_amounts[k], 2)} for k in buckets},
@@ -1380,7 +1768,7 @@ def api_aging() -> JSONResponse:
             for k, v in sorted(by_reason.items(), key=lambda x: x[1]["amount"], reverse=True)
         ],
         "items": open_items,
-    })
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -1388,55 +1776,43 @@ def api_aging() -> JSONResponse:
 # ---------------------------------------------------------------------------
 
 @app.get("/api/v1/demo/carriers")
-def api_carrier_scorecard() -> JSONResponse:
+def api_carrier_scorecard() -> ORJSONResponse:
     """Per-carrier summary: statements, lines, premium, commission, match rate, exceptions."""
-    stmt_rows = _read_csv(DATA_DIR / "raw/statements/statement_lines.csv")
-    cases = read_case_manifest(DATA_DIR / "demo_cases/case_manifest.csv")
-    case_lookup = {c["line_id"]: c for c in cases}
-
-    from app.persistence import latest_run_id, get_conn
-    run_id = latest_run_id(DB_PATH)
-    match_map: dict[str, dict] = {}
-    if run_id:
-        with get_conn(DB_PATH) as conn:
-            rows = conn.execute(
-                """SELECT line_id, status, reason, confidence
-                   FROM match_results WHERE run_id = ?""",
-                (run_id,),
-            ).fetchall()
-            match_map = {r["line_id"]: dict(r) for r in rows}
-
-    carrier_data: dict[str, dict] = {}
-    for stmt in stmt_rows:
-        c = stmt["carrier_name"]
-        if c not in carrier_data:
-            carrier_data[c] = {
-                "carrier": c,
-                "statements": set(),
-                "lines": 0,
-                "total_premium": 0.0,
-                "total_commission": 0.0,
-                "auto_matched": 0,
-                "needs_review": 0,
-                "unmatched": 0,
-                "resolved": 0,
-                "clawbacks": 0,
-                "clawback_amount": 0.0,
-                "confidence_sum": 0.0,
-                "confidence_count": 0,
-                "exception_reasons": Counter(),
-            }
-        cd = carrier_data[c]
-        cd["statements"].add(stmt["statement_id"])
-        cd["lines"] += 1
-        cd["total_premium"] += float(stmt.get("written_premium", 0))
-        cd["total_commission"] += float(stmt.get("gross_commission", 0))
+    return ORJSONResponse(_compute_carrier_scorecard())
 
-        if stmt.get("txn_type") == "clawback":
-            cd["clawbacks"] += 1
-            cd["clawback_amount"] += float(stmt.get("gross_commission", 0))
 
-        mr = match_map.get(stmt["line_id"], {})
+def _compute_carrier_scorecard() -> dict[str, Any]:
+    """Scorecard for the latest run, memoized on the run and input CSV versions; don't mutate it."""
+    return _carrier_scorecard_cached(
+        _match_state(), _csv_key(STATEMENT_LINES_CSV), _csv_key(EXPECTED_CSV), _csv_key(CASE_MANIFEST_CSV),
+    )
+
+
+@lru_cache(maxsize=4)
+def _carrier_scorecard_cached(
+    state: MatchState, stmt_key: CsvKey | None, expected_key: CsvKey | None, cases_key: CsvKey | None,
+) -> dict[str, Any]:
+    csv_keys = (stmt_key, expected_key)
+    cols = _statement_columns_cached(*csv_keys)
+    case_lookup = _index_csv_cached(cases_key, "line_id")
+    matches = _line_matches_cached(state, *csv_keys)
+
+    carrier_data: dict[str, dict] = {
+        c: {
+            **base,
+            "auto_matched": 0,
+            "needs_review": 0,
+            "unmatched": 0,
+            "resolved": 0,
+            "confidence_sum": 0.0,
+            "confidence_count": 0,
+        }
+        for c, base in _carrier_baseline_cached(*csv_keys).items()
+    }
+    # One tally over (carrier, base reason) pairs instead of a Counter per carrier
+    exception_reasons: Counter[tuple[str, str]] = Counter()
+    for line_id, c, mr in zip(cols.line_id, cols.carrier, matches):
+        cd = carrier_data[c]
         status = mr.get("status", "unknown")
         if status == "auto_matched":
             cd["auto_matched"] += 1
@@ -1452,9 +1828,14 @@ def api_carrier_scorecard() -> JSONResponse:
             cd["confidence_count"] += 1
 
         if status in ("needs_review", "unmatched"):
-            case = case_lookup.get(stmt["line_id"], {})
+            case = case_lookup.get(line_id, {})
             reason = mr.get("reason", case.get("expected_reason", "unknown")).split(",")[0]
-            cd["exception_reasons"][reason] += 1
+            exception_reasons[c, reason] += 1
+
+    # Per carrier, (reason, count) in first-seen order; the stable sort below matches most_common()
+    reasons_by_carrier: defaultdict[str, list[tuple[str, int]]] = defaultdict(list)
+    for (c, reason), count in exception_reasons.items():
+        reasons_by_carrier[c].append((reason, count))
 
     carriers = []
     for cd in sorted(carrier_data.values(), key=lambda x: x["total_commission"], reverse=True):
@@ -1462,7 +1843,7 @@ def api_carrier_scorecard() -> JSONResponse:
         matched = cd["auto_matched"] + cd["resolved"]
         carriers.append({
             "carrier": cd["carrier"],
-            "statements": len(cd["statements"]),
+            "statements": cd["statements"],
             "lines": cd["lines"],
             "total_premium": round(cd["total_premium"], 2),
             "total_commission": round(cd["total_commission"], 2),
@@ -1476,11 +1857,11 @@ def api_carrier_scorecard() -> JSONResponse:
             "clawback_amount": round(cd["clawback_amount"], 2),
             "top_exceptions": [
                 {"reason": r, "count": c}
-                for r, c in cd["exception_reasons"].most_common(5)
+                for r, c in sorted(reasons_by_carrier[cd["carrier"]], key=itemgetter(1), reverse=True)[:5]
             ],
         })
 
-    return JSONResponse({"carriers": carriers})
+    return {"carriers": carriers}
 
 
 # ---------------------------------------------------------------------------
@@ -1488,14 +1869,13 @@ def api_carrier_scorecard() -> JSONResponse:
 # ---------------------------------------------------------------------------
 
 @app.post("/api/v1/demo/background-resolve")
-def api_background_resolve(count: int = 3) -> JSONResponse:
+def api_background_resolve(count: int = 3) -> ORJSONResponse:
     """Auto-resolve the highest-confidence open exceptions (simulating background recon)."""
-    from app.persistence import latest_run_id, get_conn
-    run_id = latest_run_id(DB_PATH)
+    run_id = _latest_run_id()
     if not run_id:
-        return JSONResponse({"ok": False, "resolved": 0, "message": "No match run found"})
+        return ORJSONResponse({"ok": False, "resolved": 0, "message": "No match run found"})
 
-    with get_conn(DB_PATH) as conn:
+    with db_pool.connection() as conn:
         # Find highest-confidence open exceptions
         candidates = conn.execute(
             """SELECT e.line_id, r.confidence, r.matched_bank_txn_id
@@ -1507,25 +1887,28 @@ def api_background_resolve(count: int = 3) -> JSONResponse:
             (run_id, count),
         ).fetchall()
 
+    # All resolutions commit in one transaction
+    resolved = resolve_exceptions(DB_PATH, [
+        {
+            "line_id": c["line_id"],
+            "resolution_action": "auto_resolved",
+            "resolved_bank_txn_id": c["matched_bank_txn_id"],
+            "resolution_note": f"Background reconciliation (confidence: {c['confidence']:.1%})",
+        }
+        for c in candidates
+    ])
+    confidence = {c["line_id"]: c["confidence"] for c in candidates}
     resolved_lines = []
-    for c in candidates:
-        row = resolve_exception(
-            DB_PATH,
-            line_id=c["line_id"],
-            resolution_action="auto_resolved",
-            resolved_bank_txn_id=c["matched_bank_txn_id"],
-            resolution_note=f"Background reconciliation (confidence: {c['confidence']:.1%})",
+    for row in resolved:
+        resolved_lines.append(row["line_id"])
+        audit_log.log(
+            DB_PATH, event_type="background_recon", action="auto_resolved",
+            entity_type="line", entity_id=row["line_id"], actor="system",
+            detail=f"Auto-resolved at {confidence[row['line_id']]:.1%} confidence",
+            old_value="open", new_value="resolved",
         )
-        if row:
-            resolved_lines.append(c["line_id"])
-            log_audit_event(
-                DB_PATH, event_type="background_recon", action="auto_resolved",
-                entity_type="line", entity_id=c["line_id"], actor="system",
-                detail=f"Auto-resolved at {c['confidence']:.1%} confidence",
-                old_value="open", new_value="resolved",
-            )
-
-    return JSONResponse({
+
+    return ORJSONResponse({
         "ok": True,
         "resolved": len(resolved_lines),
         "lines": resolved_lines,
@@ -1533,21 +1916,42 @@ def api_background_resolve(count: int = 3) -> JSONResponse:
     })
 
 
+@lru_cache(maxsize=1)
+def _statement_metadata() -> tuple[dict[str, Any], ...]:
+    """statement_metadata rows; only _load_statement_metadata writes them, and it clears this."""
+    return tuple(list_statement_metadata(DB_PATH))
+
+
 @app.get("/api/v1/demo/statements")
-def api_list_statements() -> JSONResponse:
-    rows = list_statement_metadata(DB_PATH)
-    return JSONResponse({"rows": rows, "count": len(rows)})
+def api_list_statements() -> ORJSONResponse:
+    rows = _statement_metadata()
+    return ORJSONResponse({"rows": rows, "count": len(rows)})
+
+
+# Clients may store statement PDFs but revalidate each use; a regenerated file gets a new
+# mtime/size ETag, and an unchanged one costs only a 304.
+STATEMENT_PDF_CACHE_CONTROL = "public, no-cache"
 
 
 @app.get("/api/v1/demo/statements/{statement_id}.pdf")
-def api_get_statement_pdf(statement_id: str) -> FileResponse:
+def api_get_statement_pdf(statement_id: str, request: Request) -> Response:
     pdf_path = STATEMENTS_DIR / f"{statement_id}.pdf"
-    if not pdf_path.is_file():
+    try:
+        st = pdf_path.stat()
+    except FileNotFoundError:
+        st = None
+    if st is None or not S_ISREG(st.st_mode):
         raise HTTPException(status_code=404, detail="PDF not found")
+    etag = f'W/"{st.st_mtime_ns:x}-{st.st_size:x}"'
+    cache_headers = {"ETag": etag, "Cache-Control": STATEMENT_PDF_CACHE_CONTROL}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=cache_headers)
+    # FileResponse streams the file from disk (sendfile where the server supports it).
     return FileResponse(
         pdf_path,
         media_type="application/pdf",
-        headers={"Content-Disposition": f'inline; filename="{statement_id}.pdf"'},
+        stat_result=st,
+        headers={"Content-Disposition": f'inline; filename="{statement_id}.pdf"', **cache_headers},
     )
 
 
@@ -1555,102 +1959,99 @@ def api_get_statement_pdf(statement_id: str) -> FileResponse:
 # Month-End Close Dashboard (3.10)
 # ---------------------------------------------------------------------------
 
+_CLOSE_STATUS_COUNTS_SQL = """
+    SELECT 'status:' || status AS k, COUNT(*) AS n
+      FROM match_results WHERE run_id = :run_id GROUP BY status
+    UNION ALL
+    SELECT 'open_exceptions', COUNT(*)
+      FROM exceptions WHERE run_id = :run_id AND status = 'open'
+    UNION ALL
+    SELECT 'journal_posted', EXISTS(SELECT 1 FROM audit_events WHERE entity_type = 'journal')
+"""
+
+
+# (id, label) of each month-end close step, in display order.
+CLOSE_CHECKLIST = (
+    ("statements", "Carrier Statements Received"),
+    ("matching", "Matching Engine Run"),
+    ("cash", "Cash Application"),
+    ("exceptions", "Exception Resolution"),
+    ("accruals", "Accruals Calculated"),
+    ("journal", "Journal Posted to GL"),
+)
+
+
 @app.get("/api/v1/demo/close-status")
-def api_close_status() -> JSONResponse:
+def api_close_status() -> ORJSONResponse:
     """Month-end close readiness: statements, matching, exceptions, accruals, journal."""
-    from datetime import date
-    from app.persistence import latest_run_id, get_conn
-
-    stmt_rows = _read_csv(DATA_DIR / "raw/statements/statement_lines.csv")
-    bank_rows = _read_csv(DATA_DIR / "raw/bank/bank_feed.csv")
-    expected_rows = _read_csv(DATA_DIR / "expected/ams_expected.csv")
 
     # Statement coverage: unique statements received vs expected (3 carriers × ~4 statements each)
-    statements = list_statement_metadata(DB_PATH)
-    carriers = sorted(set(r["carrier_name"] for r in stmt_rows))
-    expected_statement_count = len(set(r["statement_id"] for r in stmt_rows))
+    statements = _statement_metadata()
+    by_carrier = _statements_by_carrier()
+    carriers = sorted(by_carrier)
+    expected_statement_count = len(_distinct_values(STATEMENT_LINES_CSV, "statement_id"))
     received_statement_count = len(statements)
 
     # Match run status
-    run_id = latest_run_id(DB_PATH)
-    match_stats = {"auto_matched": 0, "needs_review": 0, "unmatched": 0, "resolved": 0, "total": 0}
-    open_exceptions = 0
-    if run_id:
-        with get_conn(DB_PATH) as conn:
-            row = conn.execute(
-                """SELECT
-                    SUM(CASE WHEN status='auto_matched' THEN 1 ELSE 0 END) AS auto_matched,
-                    SUM(CASE WHEN status='needs_review' THEN 1 ELSE 0 END) AS needs_review,
-                    SUM(CASE WHEN status='unmatched' THEN 1 ELSE 0 END) AS unmatched,
-                    SUM(CASE WHEN status='resolved' THEN 1 ELSE 0 END) AS resolved,
-                    COUNT(*) AS total
-                FROM match_results WHERE run_id = ?""",
-                (run_id,),
-            ).fetchone()
-            if row:
-                match_stats = {k: int(row[k] or 0) for k in match_stats}
-            ex_row = conn.execute(
-                "SELECT COUNT(*) AS cnt FROM exceptions WHERE run_id = ? AND status = 'open'",
-                (run_id,),
-            ).fetchone()
-            open_exceptions = int(ex_row["cnt"]) if ex_row else 0
+    run_id = _latest_run_id()
+    # Per-status match counts, open exceptions and the GL posting check share one
+    # round-trip; flush first so queued journal audit events are counted.
+    audit_log.flush()
+    with db_pool.connection() as conn:
+        counts = {
+            r["k"]: r["n"]
+            for r in conn.execute(_CLOSE_STATUS_COUNTS_SQL, {"run_id": run_id})
+        }
+    match_stats = {s: counts.get(f"status:{s}", 0) for s in ("auto_matched", "needs_review", "unmatched", "resolved")}
+    match_stats["total"] = sum(n for k, n in counts.items() if k.startswith("status:"))
+    open_exceptions = counts["open_exceptions"]
+    journal_posted = bool(counts["journal_posted"])
 
     matched_total = match_stats["auto_matched"] + match_stats["resolved"]
     match_pct = round(matched_total / match_stats["total"] * 100, 1) if match_stats["total"] else 0
 
     # Cash coverage
-    total_statement_amount = sum(abs(float(r.get("gross_commission", 0))) for r in stmt_rows)
-    total_bank_amount = sum(abs(float(r.get("amount", 0))) for r in bank_rows)
-    cash_coverage_pct = round(total_bank_amount / total_statement_amount * 100, 1) if total_statement_amount else 0
-
-    # Accrual & journal status (check if audit events exist for these)
-    audit_rows = list_audit_events(DB_PATH, entity_type="journal", limit=1)
-    journal_posted = len(audit_rows) > 0
-
-    # Build checklist items
+    statement_cents, bank_cents = _cash_coverage_cents_cached(
+        _csv_key(STATEMENT_LINES_CSV), _csv_key(EXPECTED_CSV), _csv_key(BANK_FEED_CSV)
+    )
+    cash_coverage_pct = round(bank_cents / statement_cents * 100, 1) if statement_cents else 0
+
+    # Build checklist items: (status, detail, pct) per CLOSE_CHECKLIST step, in order
+    steps = (
+        (
+            "complete" if received_statement_count >= expected_statement_count else "in_progress",
+            f"{received_statement_count}/{expected_statement_count} statements",
+            round(received_statement_count / expected_statement_count * 100) if expected_statement_count else 0,
+        ),
+        (
+            "complete" if run_id else "pending",
+            f"{matched_total} matched of {match_stats['total']}" if run_id else "No match run yet",
+            match_pct if run_id else 0,
+        ),
+        (
+            "complete" if cash_coverage_pct >= 95 else "in_progress" if cash_coverage_pct > 0 else "pending",
+            f"{cash_coverage_pct}% cash coverage",
+            min(cash_coverage_pct, 100),
+        ),
+        (
+            "complete" if open_exceptions == 0 and run_id else "in_progress" if run_id else "pending",
+            f"{open_exceptions} exceptions remaining" if run_id else "Waiting for match run",
+            round((1 - open_exceptions / max(match_stats["needs_review"] + match_stats["unmatched"], 1)) * 100) if run_id else 0,
+        ),
+        (
+            "complete" if run_id else "pending",
+            "Accruals auto-calculated from match results" if run_id else "Waiting for match run",
+            100 if run_id else 0,
+        ),
+        (
+            "complete" if journal_posted else "pending",
+            "GL posting confirmed" if journal_posted else "Awaiting GL posting",
+            100 if journal_posted else 0,
+        ),
+    )
     checklist = [
-        {
-            "id": "statements",
-            "label": "Carrier Statements Received",
-            "status": "complete" if received_statement_count >= expected_statement_count else "in_progress",
-            "detail": f"{received_statement_count}/{expected_statement_count} statements",
-            "pct": round(received_statement_count / expected_statement_count * 100) if expected_statement_count else 0,
-        },
-        {
-            "id": "matching",
-            "label": "Matching Engine Run",
-            "status": "complete" if run_id else "pending",
-            "detail": f"{matched_total} matched of {match_stats['total']}" if run_id else "No match run yet",
-            "pct": match_pct if run_id else 0,
-        },
-        {
-            "id": "cash",
-            "label": "Cash Application",
-            "status": "complete" if cash_coverage_pct >= 95 else "in_progress" if cash_coverage_pct > 0 else "pending",
-            "detail": f"{cash_coverage_pct}% cash coverage",
-            "pct": min(cash_coverage_pct, 100),
-        },
-        {
-            "id": "exceptions",
-            "label": "Exception Resolution",
-            "status": "complete" if open_exceptions == 0 and run_id else "in_progress" if run_id else "pending",
-            "detail": f"{open_exceptions} exceptions remaining" if run_id else "Waiting for match run",
-            "pct": round((1 - open_exceptions / max(match_stats["needs_review"] + match_stats["unmatched"], 1)) * 100) if run_id else 0,
-        },
-        {
-            "id": "accruals",
-            "label": "Accruals Calculated",
-            "status": "complete" if run_id else "pending",
-            "detail": "Accruals auto-calculated from match results" if run_id else "Waiting for match run",
-            "pct": 100 if run_id else 0,
-        },
-        {
-            "id": "journal",
-            "label": "Journal Posted to GL",
-            "status": "complete" if journal_posted else "pending",
-            "detail": "GL posting confirmed" if journal_posted else "Awaiting GL posting",
-            "pct": 100 if journal_posted else 0,
-        },
+        {"id": step_id, "label": label, "status": status, "detail": detail, "pct": pct}
+        for (step_id, label), (status, detail, pct) in zip(CLOSE_CHECKLIST, steps)
     ]
 
     completed = sum(1 for c in checklist if c["status"] == "complete")
@@ -1664,13 +2065,14 @@ def api_close_status() -> JSONResponse:
         blockers.append("No match run executed yet — run matching first")
     if not journal_posted:
         blockers.append("Journal entries not yet posted to GL")
+    received_by_carrier = Counter(s["carrier_name"] for s in statements)
     for carrier in carriers:
-        carrier_stmts = [s for s in statements if s["carrier_name"] == carrier]
-        expected_for_carrier = len(set(r["statement_id"] for r in stmt_rows if r["carrier_name"] == carrier))
-        if len(carrier_stmts) < expected_for_carrier:
-            blockers.append(f"{carrier}: {len(carrier_stmts)}/{expected_for_carrier} statements received")
+        received_for_carrier = received_by_carrier[carrier]
+        expected_for_carrier = len(by_carrier[carrier])
+        if received_for_carrier < expected_for_carrier:
+            blockers.append(f"{carrier}: {received_for_carrier}/{expected_for_carrier} statements received")
 
-    return JSONResponse({
+    return ORJSONResponse({
         "period": "2026-01",
         "overall_pct": overall_pct,
         "completed_steps": completed,
@@ -1679,8 +2081,8 @@ def api_close_status() -> JSONResponse:
         "blockers": blockers,
         "summary": {
             "statements": received_statement_count,
-            "statement_lines": len(stmt_rows),
-            "bank_transactions": len(bank_rows),
+            "statement_lines": len(_read_csv(STATEMENT_LINES_CSV)),
+            "bank_transactions": len(_read_csv(BANK_FEED_CSV)),
             "match_pct": match_pct,
             "open_exceptions": open_exceptions,
             "cash_coverage_pct": cash_coverage_pct,
@@ -1693,87 +2095,118 @@ def api_close_status() -> JSONResponse:
 # Carrier Field Mapping Templates (3.11)
 # ---------------------------------------------------------------------------
 
-@app.get("/api/v1/demo/carrier-mappings")
-def api_carrier_mappings() -> JSONResponse:
-    """Per-carrier field mapping configuration showing how statement fields map to schema."""
+# Field mapping configuration per carrier; sample_count is filled in from the statement lines.
+CARRIER_MAPPINGS: tuple[dict[str, Any], ...] = (
+    {
+        "carrier": "Summit National",
+        "format": "PDF — Formal corporate layout",
+        "date_format": "MM/DD/YYYY",
+        "name_format": "First Last",
+        "field_mappings": [
+            {"source_column": "Policy No.", "target_field": "policy_number", "confidence": 0.98},
+            {"source_column": "Named Insured", "target_field": "insured_name", "confidence": 0.92},
+            {"source_column": "Eff. Date", "target_field": "effective_date", "confidence": 0.95},
+            {"source_column": "Written Prem", "target_field": "written_premium", "confidence": 0.99},
+            {"source_column": "Comm Amt", "target_field": "gross_commission", "confidence": 0.97},
+            {"source_column": "Trans Type", "target_field": "txn_type", "confidence": 0.94},
+        ],
+        "avg_confidence": 0.96,
+        "known_issues": ["Commission sometimes rounded to nearest dollar", "Date column occasionally blank for endorsements"],
+    },
+    {
+        "carrier": "Wilson Mutual",
+        "format": "PDF — Compact spreadsheet style",
+        "date_format": "DD-Mon-YYYY",
+        "name_format": "First Last",
+        "field_mappings": [
+            {"source_column": "POL#", "target_field": "policy_number", "confidence": 0.97},
+            {"source_column": "INSURED", "target_field": "insured_name", "confidence": 0.88},
+            {"source_column": "EFF DT", "target_field": "effective_date", "confidence": 0.93},
+            {"source_column": "PREM", "target_field": "written_premium", "confidence": 0.98},
+            {"source_column": "COMM", "target_field": "gross_commission", "confidence": 0.96},
+            {"source_column": "TYPE", "target_field": "txn_type", "confidence": 0.91},
+        ],
+        "avg_confidence": 0.94,
+        "known_issues": ["Insured name sometimes uses 'Last, First' format", "Abbreviates carrier name in bank remittance"],
+    },
+    {
+        "carrier": "Northfield Specialty",
+        "format": "PDF — Legacy/monospace layout",
+        "date_format": "YYYY-MM-DD",
+        "name_format": "Last, First (legacy)",
+        "field_mappings": [
+            {"source_column": "POLICY", "target_field": "policy_number", "confidence": 0.95},
+            {"source_column": "NAME", "target_field": "insured_name", "confidence": 0.82},
+            {"source_column": "DATE", "target_field": "effective_date", "confidence": 0.90},
+            {"source_column": "PREMIUM", "target_field": "written_premium", "confidence": 0.96},
+            {"source_column": "COMMISSION", "target_field": "gross_commission", "confidence": 0.93},
+            {"source_column": "TXN", "target_field": "txn_type", "confidence": 0.88},
+        ],
+        "avg_confidence": 0.91,
+        "known_issues": [
+            "Legacy Courier font causes OCR issues on scanned documents",
+            "Name always in 'Last, First' format — needs normalization",
+            "Slight page rotation on scanned PDFs reduces confidence",
+        ],
+    },
+)
+
+
+@lru_cache(maxsize=4)
+def _carrier_mappings_json_cached(stmt_key: CsvKey | None) -> bytes:
+    by_carrier = _statements_by_carrier_cached(stmt_key)
     mappings = [
-        {
-            "carrier": "Summit National",
-            "format": "PDF — Formal corporate layout",
-            "date_format": "MM/DD/YYYY",
-            "name_format": "First Last",
-            "field_mappings": [
-                {"source_column": "Policy No.", "target_field": "policy_number", "confidence": 0.98},
-                {"source_column": "Named Insured", "target_field": "insured_name", "confidence": 0.92},
-                {"source_column": "Eff. Date", "target_field": "effective_date", "confidence": 0.95},
-                {"source_column": "Written Prem", "target_field": "written_premium", "confidence": 0.99},
-                {"source_column": "Comm Amt", "target_field": "gross_commission", "confidence": 0.97},
-                {"source_column": "Trans Type", "target_field": "txn_type", "confidence": 0.94},
-            ],
-            "avg_confidence": 0.96,
-            "known_issues": ["Commission sometimes rounded to nearest dollar", "Date column occasionally blank for endorsements"],
-            "sample_count": 0,
-        },
-        {
-            "carrier": "Wilson Mutual",
-            "format": "PDF — Compact spreadsheet style",
-            "date_format": "DD-Mon-YYYY",
-            "name_format": "First Last",
-            "field_mappings": [
-                {"source_column": "POL#", "target_field": "policy_number", "confidence": 0.97},
-                {"source_column": "INSURED", "target_field": "insured_name", "confidence": 0.88},
-                {"source_column": "EFF DT", "target_field": "effective_date", "confidence": 0.93},
-                {"source_column": "PREM", "target_field": "written_premium", "confidence": 0.98},
-                {"source_column": "COMM", "target_field": "gross_commission", "confidence": 0.96},
-                {"source_column": "TYPE", "target_field": "txn_type", "confidence": 0.91},
-            ],
-            "avg_confidence": 0.94,
-            "known_issues": ["Insured name sometimes uses 'Last, First' format", "Abbreviates carrier name in bank remittance"],
-            "sample_count": 0,
-        },
-        {
-            "carrier": "Northfield Specialty",
-            "format": "PDF — Legacy/monospace layout",
-            "date_format": "YYYY-MM-DD",
-            "name_format": "Last, First (legacy)",
-            "field_mappings": [
-                {"source_column": "POLICY", "target_field": "policy_number", "confidence": 0.95},
-                {"source_column": "NAME", "target_field": "insured_name", "confidence": 0.82},
-                {"source_column": "DATE", "target_field": "effective_date", "confidence": 0.90},
-                {"source_column": "PREMIUM", "target_field": "written_premium", "confidence": 0.96},
-                {"source_column": "COMMISSION", "target_field": "gross_commission", "confidence": 0.93},
-                {"source_column": "TXN", "target_field": "txn_type", "confidence": 0.88},
-            ],
-            "avg_confidence": 0.91,
-            "known_issues": [
-                "Legacy Courier font causes OCR issues on scanned documents",
-                "Name always in 'Last, First' format — needs normalization",
-                "Slight page rotation on scanned PDFs reduces confidence",
-            ],
-            "sample_count": 0,
-        },
+        {**m, "sample_count": sum(len(lines) for lines in by_carrier.get(m["carrier"], {}).values())}
+        for m in CARRIER_MAPPINGS
     ]
+    return orjson.dumps({"mappings": mappings})
 
-    # Enrich with actual line counts
-    stmt_rows = _read_csv(DATA_DIR / "raw/statements/statement_lines.csv")
-    for m in mappings:
-        m["sample_count"] = len([r for r in stmt_rows if r["carrier_name"] == m["carrier"]])
 
-    return JSONResponse({"mappings": mappings})
+@app.get("/api/v1/demo/carrier-mappings")
+def api_carrier_mappings() -> Response:
+    """Per-carrier field mapping configuration showing how statement fields map to schema."""
+    return Response(_carrier_mappings_json_cached(_csv_key(STATEMENT_LINES_CSV)), media_type="application/json")
 
 
 # ---------------------------------------------------------------------------
 # Recalculation Snapshots (3.13)
 # ---------------------------------------------------------------------------
 
+_RUN_CHANGE_COLUMNS = ("matched_bank_txn_id", "status", "reason", "confidence")
+RUN_COMPARISON_CHANGES_SHOWN = 100
+
+_RUN_CHANGES_SQL = """
+    SELECT b.line_id, a.line_id IS NOT NULL AS in_a,
+           a.matched_bank_txn_id, a.status, a.reason, a.confidence,
+           b.matched_bank_txn_id, b.status, b.reason, b.confidence
+    FROM match_results b
+    LEFT JOIN match_results a ON a.run_id = :run_a AND a.line_id = b.line_id
+    WHERE b.run_id = :run_b
+      AND (a.line_id IS NULL OR a.status != b.status
+           OR ABS(COALESCE(a.confidence, 0) - COALESCE(b.confidence, 0)) > 0.001)
+    ORDER BY b.line_id
+"""
+
+
+@lru_cache(maxsize=4)
+def _run_changes(state: MatchState, run_a: str, run_b: str) -> tuple[tuple[str, dict[str, Any] | None, dict[str, Any]], ...]:
+    """(line_id, result in run A, result in run B) for run-B lines that are new or whose
+    status or confidence moved, in line_id order. SQLite filters out unchanged lines."""
+    with db_pool.connection() as conn:
+        rows = conn.execute(_RUN_CHANGES_SQL, {"run_a": run_a, "run_b": run_b}).fetchall()
+    return tuple(
+        (r[0], dict(zip(_RUN_CHANGE_COLUMNS, r[2:6])) if r[1] else None, dict(zip(_RUN_CHANGE_COLUMNS, r[6:10])))
+        for r in rows
+    )
+
+
 @app.get("/api/v1/demo/run-comparison")
-def api_run_comparison() -> JSONResponse:
+def api_run_comparison() -> ORJSONResponse:
     """Compare two most recent match runs to show what changed."""
-    from app.persistence import get_conn
-
-    runs = list_match_runs(DB_PATH, limit=10)
+    state = _match_state()
+    runs = _match_runs(state, 10)
     if len(runs) < 2:
-        return JSONResponse({
+        return ORJSONResponse({
             "available": False,
             "message": "Need at least 2 match runs to compare. Run matching multiple times.",
             "runs": runs,
@@ -1782,58 +2215,50 @@ def api_run_comparison() -> JSONResponse:
     run_a = runs[1]  # older
     run_b = runs[0]  # newer
 
-    with get_conn(DB_PATH) as conn:
-        rows_a = conn.execute(
-            "SELECT line_id, status, confidence, reason, matched_bank_txn_id FROM match_results WHERE run_id = ?",
-            (run_a["run_id"],),
-        ).fetchall()
-        rows_b = conn.execute(
-            "SELECT line_id, status, confidence, reason, matched_bank_txn_id FROM match_results WHERE run_id = ?",
-            (run_b["run_id"],),
-        ).fetchall()
-
-    map_a = {r["line_id"]: dict(r) for r in rows_a}
-    map_b = {r["line_id"]: dict(r) for r in rows_b}
-
-    # Compute deltas
+    # Counters cover every change; only the first RUN_COMPARISON_CHANGES_SHOWN become dicts.
     changes = []
+    total_changes = improved = regressed = 0
     status_transitions = Counter()
     confidence_deltas = []
 
-    all_lines = set(map_a.keys()) | set(map_b.keys())
-    for line_id in sorted(all_lines):
-        a = map_a.get(line_id)
-        b = map_b.get(line_id)
-
-        if a and b:
-            if a["status"] != b["status"] or abs((a["confidence"] or 0) - (b["confidence"] or 0)) > 0.001:
-                transition = f"{a['status']} → {b['status']}"
-                status_transitions[transition] += 1
-                conf_delta = (b["confidence"] or 0) - (a["confidence"] or 0)
-                confidence_deltas.append(conf_delta)
-
-                explanation = []
-                if a["status"] != b["status"]:
-                    explanation.append(f"Status: {a['status']} → {b['status']}")
-                if a["reason"] != b["reason"]:
-                    explanation.append(f"Reason: {a['reason']} → {b['reason']}")
-                if abs(conf_delta) > 0.001:
-                    explanation.append(f"Confidence: {a['confidence']:.1%} → {b['confidence']:.1%}")
-                if a.get("matched_bank_txn_id") != b.get("matched_bank_txn_id"):
-                    explanation.append(f"Bank txn: {a.get('matched_bank_txn_id', 'none')} → {b.get('matched_bank_txn_id', 'none')}")
-
-                changes.append({
-                    "line_id": line_id,
-                    "old_status": a["status"],
-                    "new_status": b["status"],
-                    "old_confidence": a["confidence"],
-                    "new_confidence": b["confidence"],
-                    "confidence_delta": round(conf_delta, 4),
-                    "old_reason": a["reason"],
-                    "new_reason": b["reason"],
-                    "explanation": "; ".join(explanation),
-                })
-        elif b and not a:
+    # Lines only in run A are not reported; unchanged lines never leave SQLite.
+    for line_id, a, b in _run_changes(state, run_a["run_id"], run_b["run_id"]):
+        total_changes += 1
+        show = len(changes) < RUN_COMPARISON_CHANGES_SHOWN
+        if a:
+            transition = f"{a['status']} → {b['status']}"
+            status_transitions[transition] += 1
+            conf_delta = (b["confidence"] or 0) - (a["confidence"] or 0)
+            confidence_deltas.append(conf_delta)
+            if a["status"] in ("needs_review", "unmatched") and b["status"] in ("auto_matched", "resolved"):
+                improved += 1
+            elif a["status"] in ("auto_matched", "resolved") and b["status"] in ("needs_review", "unmatched"):
+                regressed += 1
+            if not show:
+                continue
+
+            explanation = []
+            if a["status"] != b["status"]:
+                explanation.append(f"Status: {a['status']} → {b['status']}")
+            if a["reason"] != b["reason"]:
+                explanation.append(f"Reason: {a['reason']} → {b['reason']}")
+            if abs(conf_delta) > 0.001:
+                explanation.append(f"Confidence: {a['confidence']:.1%} → {b['confidence']:.1%}")
+            if a.get("matched_bank_txn_id") != b.get("matched_bank_txn_id"):
+                explanation.append(f"Bank txn: {a.get('matched_bank_txn_id', 'none')} → {b.get('matched_bank_txn_id', 'none')}")
+
+            changes.append({
+                "line_id": line_id,
+                "old_status": a["status"],
+                "new_status": b["status"],
+                "old_confidence": a["confidence"],
+                "new_confidence": b["confidence"],
+                "confidence_delta": round(conf_delta, 4),
+                "old_reason": a["reason"],
+                "new_reason": b["reason"],
+                "explanation": "; ".join(explanation),
+            })
+        elif show:
             changes.append({
                 "line_id": line_id,
                 "old_status": None,
@@ -1847,36 +2272,43 @@ def api_run_comparison() -> JSONResponse:
             })
 
     # Summary stats
-    improved = len([c for c in changes if c["old_status"] in ("needs_review", "unmatched") and c["new_status"] in ("auto_matched", "resolved")])
-    regressed = len([c for c in changes if c["old_status"] in ("auto_matched", "resolved") and c["new_status"] in ("needs_review", "unmatched")])
     avg_conf_delta = round(sum(confidence_deltas) / len(confidence_deltas), 4) if confidence_deltas else 0
 
-    return JSONResponse({
+    return ORJSONResponse({
         "available": True,
         "run_a": {"run_id": run_a["run_id"], "created_at": run_a["created_at"],
                   "auto_matched": run_a["auto_matched"], "needs_review": run_a["needs_review"], "unmatched": run_a["unmatched"]},
         "run_b": {"run_id": run_b["run_id"], "created_at": run_b["created_at"],
                   "auto_matched": run_b["auto_matched"], "needs_review": run_b["needs_review"], "unmatched": run_b["unmatched"]},
-        "total_changes": len(changes),
+        "total_changes": total_changes,
         "improved": improved,
         "regressed": regressed,
         "avg_confidence_delta": avg_conf_delta,
         "status_transitions": [{"transition": k, "count": v} for k, v in status_transitions.most_common()],
-        "changes": changes[:100],
+        "changes": changes,
     })
 
 
 # SPA catch-all: serve React app for non-API routes
-if STATIC_DIR.is_dir():
+if (STATIC_DIR / "index.html").is_file():
+    if (STATIC_DIR / "assets").is_dir():
+        app.mount("/assets", StaticFiles(directory=STATIC_DIR / "assets"), name="assets")
+
+    _INDEX_HTML = (STATIC_DIR / "index.html").read_bytes()
+
+    def _index_response() -> HTMLResponse:
+        return HTMLResponse(_INDEX_HTML, headers={"Cache-Control": "no-cache"})
+
     @app.get("/{full_path:path}")
-    def spa_catch_all(full_path: str) -> FileResponse:
-        file_path = STATIC_DIR / full_path
-        if file_path.is_file():
+    def spa_catch_all(full_path: str) -> Response:
+        # Client-side routes have no file extension; answer them from memory without a stat.
+        if "." not in full_path.rsplit("/", 1)[-1]:
+            return _index_response()
+        file_path = (STATIC_DIR / full_path).resolve()
+        if file_path.is_relative_to(STATIC_DIR) and file_path.is_file():
             return FileResponse(file_path)
-        return FileResponse(STATIC_DIR / "index.html")
+        return _index_response()
 else:
-    from fastapi.responses import HTMLResponse
-
     @app.get("/", response_class=HTMLResponse)
     def homepage() -> str:
         return """<!doctype html>
@@ -1890,39 +2322,59 @@ else:
 @app.on_event("startup")
 def on_startup() -> None:
     init_db(DB_PATH)
+    db_pool.open()
+    audit_log.start()
+    _warm_csv_caches()
     _load_statement_metadata()
+    demo_summary()
+
+
+@app.on_event("shutdown")
+def on_shutdown() -> None:
+    audit_log.stop()
+    db_pool.close()
 
 
 def _load_statement_metadata() -> None:
-    """Scan statement CSVs and PDFs to populate statement_metadata table."""
-    csv_path = DATA_DIR / "raw/statements/statement_lines.csv"
-    if not csv_path.exists():
+    """Aggregate statement lines per statement and upsert statement_metadata in one batch."""
+    if not STATEMENT_LINES_CSV.exists():
         return
 
-    rows = []
-    with csv_path.open(newline="", encoding="utf-8") as f:
-        rows = list(csv.DictReader(f))
-
-    grouped: dict[str, list[dict]] = {}
-    for row in rows:
-        grouped.setdefault(row["statement_id"], []).append(row)
-
-    for statement_id, lines in grouped.items():
-        carrier = lines[0]["carrier_name"]
-        total_premium = sum(float(r["written_premium"]) for r in lines)
-        total_commission = sum(float(r["gross_commission"]) for r in lines)
-        eff_dates = [r["effective_date"] for r in lines if r.get("effective_date")]
-        pdf_path = DATA_DIR / "raw/statements" / f"{statement_id}.pdf"
-        upsert_statement_metadata(
-            DB_PATH,
-            {
-                "statement_id": statement_id,
-                "carrier_name": carrier,
-                "line_count": len(lines),
-                "total_premium": round(total_premium, 2),
-                "total_commission": round(total_commission, 2),
-                "min_effective_date": min(eff_dates) if eff_dates else None,
-                "max_effective_date": max(eff_dates) if eff_dates else None,
-                "pdf_path": str(pdf_path) if pdf_path.exists() else None,
-            },
-        )
+    cols = _statement_columns()
+    agg: dict[str, dict[str, Any]] = {}
+    for row, statement_id, carrier, premium, commission in zip(
+        _read_csv(STATEMENT_LINES_CSV), cols.statement_id, cols.carrier, cols.written_premium, cols.statement,
+    ):
+        a = agg.get(statement_id)
+        if a is None:
+            a = agg[statement_id] = {
+                "carrier_name": carrier, "line_count": 0,
+                "premium": 0.0, "commission": 0.0, "min_eff": None, "max_eff": None,
+            }
+        a["line_count"] += 1
+        a["premium"] += premium
+        a["commission"] += commission
+        eff = row.get("effective_date")
+        if eff:
+            if a["min_eff"] is None or eff < a["min_eff"]:
+                a["min_eff"] = eff
+            if a["max_eff"] is None or eff > a["max_eff"]:
+                a["max_eff"] = eff
+
+    # One directory listing instead of an exists() call per statement
+    pdf_names = {p.name for p in STATEMENTS_DIR.glob("*.pdf")}
+    metas = []
+    for statement_id, a in agg.items():
+        pdf_path = STATEMENTS_DIR / f"{statement_id}.pdf"
+        metas.append({
+            "statement_id": statement_id,
+            "carrier_name": a["carrier_name"],
+            "line_count": a["line_count"],
+            "total_premium": round(a["premium"], 2),
+            "total_commission": round(a["commission"], 2),
+            "min_effective_date": a["min_eff"],
+            "max_effective_date": a["max_eff"],
+            "pdf_path": str(pdf_path) if pdf_path.name in pdf_names else None,
+        })
+    upsert_statement_metadata_many(DB_PATH, metas)
+    _statement_metadata.cache_clear()
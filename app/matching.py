@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from datetime import date
 from difflib import SequenceMatcher
 from pathlib import Path
-from typing import Any
+from typing import Any, Sequence
 
 
 @dataclass
@@ -74,10 +74,18 @@ def _score(statement: dict[str, str], cash: dict[str, str], policy_for_matching:
     return min(score, 1.0), ",".join(details)
 
 
-def run_matching(data_dir: Path, policy_overrides: dict[str, str] | None = None) -> dict[str, Any]:
+def run_matching(
+    data_dir: Path,
+    policy_overrides: dict[str, str] | None = None,
+    statements: Sequence[dict[str, str]] | None = None,
+    cash: Sequence[dict[str, str]] | None = None,
+) -> dict[str, Any]:
+    # Callers that already hold parsed statement/bank rows pass them to skip the CSV reads.
     policy_overrides = policy_overrides or {}
-    statements = _read_csv(data_dir / "raw/statements/statement_lines.csv")
-    cash = _read_csv(data_dir / "raw/bank/bank_feed.csv")
+    if statements is None:
+        statements = _read_csv(data_dir / "raw/statements/statement_lines.csv")
+    if cash is None:
+        cash = _read_csv(data_dir / "raw/bank/bank_feed.csv")
 
     unmatched_cash = set(range(len(cash)))
     results: list[MatchResult] = []
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import queue
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 
 def utc_now() -> str:
@@ -17,8 +20,111 @@ def get_conn(db_path: Path) -> sqlite3.Connection:
     return conn
 
 
+# Applied to each pooled connection. WAL lets readers run alongside the audit
+# writer; init_db already switches the file, so here journal_mode=WAL is a no-op
+# kept for pools opened on a database init_db hasn't touched. mmap_size serves page reads from a memory map (SQLite caps it at the
+# address space available, so 32-bit builds get less than 1 GiB); a negative
+# cache_size is in KiB, so each connection caches up to 64 MiB of pages.
+POOL_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA mmap_size=1073741824",
+    "PRAGMA cache_size=-65536",
+)
+# Prepared statements kept per pooled connection, keyed by SQL text; request-path
+# queries are module constants so repeat calls skip sqlite3_prepare.
+POOL_CACHED_STATEMENTS = 256
+
+
+class ConnectionPool:
+    """Long-lived connections to one database, each checked out by one caller at a time.
+
+    Connections are opened on demand up to ``size``; callers beyond that wait for
+    one to be returned. connection() wraps the checkout in a transaction like
+    ``with get_conn(...) as conn`` does.
+    """
+
+    def __init__(self, db_path: Path, size: int = 8) -> None:
+        self.db_path = db_path
+        self.size = size
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._opened = 0
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=POOL_CACHED_STATEMENTS)
+        conn.row_factory = sqlite3.Row
+        for pragma in POOL_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def _checkout(self) -> sqlite3.Connection:
+        while True:
+            if self._closed:
+                raise RuntimeError("connection pool is closed")
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+            with self._lock:
+                can_open = self._opened < self.size
+                if can_open:
+                    self._opened += 1
+            if can_open:
+                try:
+                    return self._connect()
+                except BaseException:
+                    with self._lock:
+                        self._opened -= 1
+                    raise
+            # All connections are busy; wait for one, rechecking whether the pool was closed
+            try:
+                return self._idle.get(timeout=0.1)
+            except queue.Empty:
+                pass
+
+    def _checkin(self, conn: sqlite3.Connection) -> None:
+        with self._lock:
+            if not self._closed:
+                self._idle.put(conn)
+                return
+            self._opened -= 1
+        conn.close()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        conn = self._checkout()
+        try:
+            with conn:
+                yield conn
+        finally:
+            self._checkin(conn)
+
+    def open(self) -> None:
+        """Accept checkouts again after close(); connections are reopened on demand."""
+        with self._lock:
+            self._closed = False
+
+    def close(self) -> None:
+        """Close idle connections and refuse new checkouts; busy ones are closed when returned."""
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._lock:
+                self._opened -= 1
+
+
 def init_db(db_path: Path) -> None:
     with get_conn(db_path) as conn:
+        # WAL is a property of the database file; switching here, before any pooled
+        # connection opens, keeps POOL_PRAGMAS from needing an exclusive lock later.
+        conn.execute("PRAGMA journal_mode=WAL")
         conn.executescript(
             """
             CREATE TABLE IF NOT EXISTS match_runs (
@@ -38,6 +144,14 @@ def init_db(db_path: Path) -> None:
                 FOREIGN KEY (run_id) REFERENCES match_runs(run_id)
             );
 
+            -- Per-run reads (status maps, aggregations) are served from the index alone.
+            CREATE INDEX IF NOT EXISTS idx_match_results_run_covering
+                ON match_results(run_id, line_id, status, confidence, reason, matched_bank_txn_id);
+
+            -- Background resolution walks a run's results by descending confidence.
+            CREATE INDEX IF NOT EXISTS idx_match_results_run_conf
+                ON match_results(run_id, confidence DESC);
+
             CREATE TABLE IF NOT EXISTS exceptions (
                 run_id TEXT NOT NULL,
                 line_id TEXT NOT NULL,
@@ -52,6 +166,9 @@ def init_db(db_path: Path) -> None:
                 FOREIGN KEY (run_id, line_id) REFERENCES match_results(run_id, line_id)
             );
 
+            CREATE INDEX IF NOT EXISTS idx_exceptions_run_status
+                ON exceptions(run_id, status);
+
             CREATE TABLE IF NOT EXISTS policy_rules (
                 source_policy_number TEXT PRIMARY KEY,
                 target_policy_number TEXT NOT NULL,
@@ -123,6 +240,10 @@ def init_db(db_path: Path) -> None:
                 old_value TEXT,
                 new_value TEXT
             );
+
+            -- Entity filters (line history, journal posted check) seek instead of scanning.
+            CREATE INDEX IF NOT EXISTS idx_audit_events_entity
+                ON audit_events(entity_type, entity_id);
             """
         )
 
@@ -183,10 +304,15 @@ def save_match_run(db_path: Path, run_id: str, results: list[dict[str, Any]]) ->
 
 def latest_run_id(db_path: Path) -> str | None:
     with get_conn(db_path) as conn:
-        row = conn.execute(
-            "SELECT run_id FROM match_runs ORDER BY created_at DESC LIMIT 1"
-        ).fetchone()
-        return None if row is None else str(row["run_id"])
+        return select_latest_run_id(conn)
+
+
+def select_latest_run_id(conn: sqlite3.Connection) -> str | None:
+    """latest_run_id on an open (e.g. pooled) connection."""
+    row = conn.execute(
+        "SELECT run_id FROM match_runs ORDER BY created_at DESC LIMIT 1"
+    ).fetchone()
+    return None if row is None else str(row["run_id"])
 
 
 def list_exceptions(db_path: Path, status: str = "open", limit: int = 100) -> list[dict[str, Any]]:
@@ -233,49 +359,84 @@ def resolve_exception(
         return None
 
     with get_conn(db_path) as conn:
-        exists = conn.execute(
-            """
-            SELECT line_id FROM exceptions
-            WHERE run_id = ? AND line_id = ? AND status = 'open'
-            """,
-            (run_id, line_id),
-        ).fetchone()
-        if exists is None:
-            return None
-
-        conn.execute(
-            """
-            UPDATE exceptions
-            SET status = 'resolved',
-                resolution_action = ?,
-                resolved_bank_txn_id = ?,
-                resolution_note = ?,
-                updated_at = ?
-            WHERE run_id = ? AND line_id = ?
-            """,
-            (resolution_action, resolved_bank_txn_id, resolution_note, utc_now(), run_id, line_id),
+        return _resolve_exception(
+            conn, utc_now(), run_id, line_id, resolution_action,
+            resolved_bank_txn_id=resolved_bank_txn_id, resolution_note=resolution_note,
         )
 
-        conn.execute(
-            """
-            UPDATE match_results
-            SET status = 'resolved',
-                matched_bank_txn_id = COALESCE(?, matched_bank_txn_id),
-                reason = reason || ',manual_resolution'
-            WHERE run_id = ? AND line_id = ?
-            """,
-            (resolved_bank_txn_id, run_id, line_id),
-        )
 
-        row = conn.execute(
-            """
-            SELECT run_id, line_id, status, resolution_action, resolved_bank_txn_id, resolution_note, updated_at
-            FROM exceptions
-            WHERE run_id = ? AND line_id = ?
-            """,
-            (run_id, line_id),
-        ).fetchone()
-        return None if row is None else dict(row)
+def resolve_exceptions(db_path: Path, resolutions: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Resolve many open exceptions of the latest run in one transaction.
+
+    Each dict takes resolve_exception's keyword args; returns the rows actually resolved, in order.
+    """
+    if not resolutions:
+        return []
+    now = utc_now()
+    resolved = []
+    with get_conn(db_path) as conn:
+        run_id = select_latest_run_id(conn)
+        if run_id is None:
+            return []
+        for resolution in resolutions:
+            row = _resolve_exception(conn, now, run_id, **resolution)
+            if row is not None:
+                resolved.append(row)
+    return resolved
+
+
+def _resolve_exception(
+    conn: sqlite3.Connection,
+    now: str,
+    run_id: str,
+    line_id: str,
+    resolution_action: str,
+    resolved_bank_txn_id: str | None = None,
+    resolution_note: str | None = None,
+) -> dict[str, Any] | None:
+    exists = conn.execute(
+        """
+        SELECT line_id FROM exceptions
+        WHERE run_id = ? AND line_id = ? AND status = 'open'
+        """,
+        (run_id, line_id),
+    ).fetchone()
+    if exists is None:
+        return None
+
+    conn.execute(
+        """
+        UPDATE exceptions
+        SET status = 'resolved',
+            resolution_action = ?,
+            resolved_bank_txn_id = ?,
+            resolution_note = ?,
+            updated_at = ?
+        WHERE run_id = ? AND line_id = ?
+        """,
+        (resolution_action, resolved_bank_txn_id, resolution_note, now, run_id, line_id),
+    )
+
+    conn.execute(
+        """
+        UPDATE match_results
+        SET status = 'resolved',
+            matched_bank_txn_id = COALESCE(?, matched_bank_txn_id),
+            reason = reason || ',manual_resolution'
+        WHERE run_id = ? AND line_id = ?
+        """,
+        (resolved_bank_txn_id, run_id, line_id),
+    )
+
+    row = conn.execute(
+        """
+        SELECT run_id, line_id, status, resolution_action, resolved_bank_txn_id, resolution_note, updated_at
+        FROM exceptions
+        WHERE run_id = ? AND line_id = ?
+        """,
+        (run_id, line_id),
+    ).fetchone()
+    return None if row is None else dict(row)
 
 
 def upsert_policy_rule(
@@ -377,6 +538,40 @@ def list_match_results(
         return [dict(row) for row in rows], run_id
 
 
+_EXCEPTION_COLUMNS = (
+    "run_id", "line_id", "reason", "suggested_bank_txn_id", "status",
+    "resolution_action", "resolved_bank_txn_id", "resolution_note", "updated_at",
+)
+
+
+_LINE_MATCH_SQL = f"""
+    SELECT r.line_id, r.policy_number, r.matched_bank_txn_id, r.confidence, r.status, r.reason,
+           e.line_id IS NOT NULL AS has_exception,
+           {", ".join(f"e.{c} AS ex_{c}" for c in _EXCEPTION_COLUMNS)}
+    FROM match_results r
+    LEFT JOIN exceptions e
+      ON e.run_id = r.run_id AND e.line_id = r.line_id
+    WHERE r.run_id = ? AND r.line_id = ?
+"""
+
+
+def select_line_match(
+    conn: sqlite3.Connection, run_id: str, line_id: str
+) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+    """Match result and exception row for one line of a run, fetched in a single query.
+
+    Runs on an open (e.g. pooled) connection. The SQL text is a module constant, so pooled connections hit their statement cache.
+    """
+    row = conn.execute(_LINE_MATCH_SQL, (run_id, line_id)).fetchone()
+    if row is None:
+        return None, None
+    match_result = {
+        k: row[k] for k in ("line_id", "policy_number", "matched_bank_txn_id", "confidence", "status", "reason")
+    }
+    exception = {c: row[f"ex_{c}"] for c in _EXCEPTION_COLUMNS} if row["has_exception"] else None
+    return match_result, exception
+
+
 def load_policy_overrides(db_path: Path) -> dict[str, str]:
     with get_conn(db_path) as conn:
         rows = conn.execute(
@@ -386,8 +581,13 @@ def load_policy_overrides(db_path: Path) -> dict[str, str]:
 
 
 def upsert_statement_metadata(db_path: Path, meta: dict[str, Any]) -> None:
+    upsert_statement_metadata_many(db_path, [meta])
+
+
+def upsert_statement_metadata_many(db_path: Path, metas: list[dict[str, Any]]) -> int:
+    """Insert or update many statement_metadata rows in one transaction."""
     with get_conn(db_path) as conn:
-        conn.execute(
+        conn.executemany(
             """
             INSERT INTO statement_metadata(
                 statement_id, carrier_name, line_count, total_premium,
@@ -402,17 +602,21 @@ def upsert_statement_metadata(db_path: Path, meta: dict[str, Any]) -> None:
                 max_effective_date=excluded.max_effective_date,
                 pdf_path=excluded.pdf_path
             """,
-            (
-                meta["statement_id"],
-                meta["carrier_name"],
-                meta["line_count"],
-                meta["total_premium"],
-                meta["total_commission"],
-                meta.get("min_effective_date"),
-                meta.get("max_effective_date"),
-                meta.get("pdf_path"),
-            ),
+            [
+                (
+                    meta["statement_id"],
+                    meta["carrier_name"],
+                    meta["line_count"],
+                    meta["total_premium"],
+                    meta["total_commission"],
+                    meta.get("min_effective_date"),
+                    meta.get("max_effective_date"),
+                    meta.get("pdf_path"),
+                )
+                for meta in metas
+            ],
         )
+    return len(metas)
 
 
 def list_statement_metadata(db_path: Path) -> list[dict[str, Any]]:
@@ -445,53 +649,82 @@ def upsert_split_rule(
     effective_to: str | None = None,
     note: str | None = None,
 ) -> dict[str, Any]:
+    with get_conn(db_path) as conn:
+        rule_id = _upsert_split_rule(
+            conn, utc_now(), producer_id, split_pct, house_pct, carrier=carrier, lob=lob,
+            fee_type=fee_type, fee_amount=fee_amount, effective_from=effective_from,
+            effective_to=effective_to, note=note,
+        )
+        row = conn.execute("SELECT * FROM split_rules WHERE rule_id = ?", (rule_id,)).fetchone()
+        return dict(row) if row else {}
+
+
+def upsert_split_rules(db_path: Path, rules: list[dict[str, Any]]) -> int:
+    """Upsert many split rules in one transaction; each dict takes upsert_split_rule's keyword args."""
     now = utc_now()
     with get_conn(db_path) as conn:
-        # Check for existing rule to determine version
-        existing = conn.execute(
-            """SELECT rule_id, version FROM split_rules
-               WHERE producer_id = ? AND COALESCE(carrier,'') = COALESCE(?,'')
-               AND COALESCE(lob,'') = COALESCE(?,'')""",
-            (producer_id, carrier or '', lob or ''),
-        ).fetchone()
+        for rule in rules:
+            _upsert_split_rule(conn, now, **rule)
+    return len(rules)
 
-        if existing:
-            new_version = existing["version"] + 1
-            old_row = dict(conn.execute("SELECT * FROM split_rules WHERE rule_id = ?", (existing["rule_id"],)).fetchone())
-            conn.execute(
-                """UPDATE split_rules SET split_pct=?, house_pct=?, fee_type=?, fee_amount=?,
-                   effective_from=?, effective_to=?, note=?, version=?, updated_at=?
-                   WHERE rule_id=?""",
-                (split_pct, house_pct, fee_type, fee_amount, effective_from, effective_to, note, new_version, now, existing["rule_id"]),
-            )
-            rule_id = existing["rule_id"]
-            # Log version
-            conn.execute(
-                """INSERT INTO rule_versions(rule_type, rule_id, version, changed_by, changed_at, change_type, old_value, new_value, detail)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                ("split_rule", str(rule_id), new_version, "analyst", now, "updated",
-                 f"split={old_row['split_pct']}%/house={old_row['house_pct']}%",
-                 f"split={split_pct}%/house={house_pct}%",
-                 note),
-            )
-        else:
-            cur = conn.execute(
-                """INSERT INTO split_rules(producer_id, carrier, lob, split_pct, house_pct,
-                   fee_type, fee_amount, effective_from, effective_to, note, version, created_at, updated_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?)""",
-                (producer_id, carrier, lob, split_pct, house_pct, fee_type, fee_amount,
-                 effective_from, effective_to, note, now, now),
-            )
-            rule_id = cur.lastrowid
-            conn.execute(
-                """INSERT INTO rule_versions(rule_type, rule_id, version, changed_by, changed_at, change_type, new_value, detail)
-                   VALUES (?, ?, 1, ?, ?, ?, ?, ?)""",
-                ("split_rule", str(rule_id), "analyst", now, "created",
-                 f"split={split_pct}%/house={house_pct}%", note),
-            )
 
-        row = conn.execute("SELECT * FROM split_rules WHERE rule_id = ?", (rule_id,)).fetchone()
-        return dict(row) if row else {}
+def _upsert_split_rule(
+    conn: sqlite3.Connection,
+    now: str,
+    producer_id: str,
+    split_pct: float,
+    house_pct: float,
+    carrier: str | None = None,
+    lob: str | None = None,
+    fee_type: str = "percentage",
+    fee_amount: float = 0.0,
+    effective_from: str | None = None,
+    effective_to: str | None = None,
+    note: str | None = None,
+) -> int:
+    # Check for existing rule to determine version
+    existing = conn.execute(
+        """SELECT rule_id, version FROM split_rules
+           WHERE producer_id = ? AND COALESCE(carrier,'') = COALESCE(?,'')
+           AND COALESCE(lob,'') = COALESCE(?,'')""",
+        (producer_id, carrier or '', lob or ''),
+    ).fetchone()
+
+    if existing:
+        new_version = existing["version"] + 1
+        old_row = dict(conn.execute("SELECT * FROM split_rules WHERE rule_id = ?", (existing["rule_id"],)).fetchone())
+        conn.execute(
+            """UPDATE split_rules SET split_pct=?, house_pct=?, fee_type=?, fee_amount=?,
+               effective_from=?, effective_to=?, note=?, version=?, updated_at=?
+               WHERE rule_id=?""",
+            (split_pct, house_pct, fee_type, fee_amount, effective_from, effective_to, note, new_version, now, existing["rule_id"]),
+        )
+        rule_id = existing["rule_id"]
+        # Log version
+        conn.execute(
+            """INSERT INTO rule_versions(rule_type, rule_id, version, changed_by, changed_at, change_type, old_value, new_value, detail)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            ("split_rule", str(rule_id), new_version, "analyst", now, "updated",
+             f"split={old_row['split_pct']}%/house={old_row['house_pct']}%",
+             f"split={split_pct}%/house={house_pct}%",
+             note),
+        )
+    else:
+        cur = conn.execute(
+            """INSERT INTO split_rules(producer_id, carrier, lob, split_pct, house_pct,
+               fee_type, fee_amount, effective_from, effective_to, note, version, created_at, updated_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?)""",
+            (producer_id, carrier, lob, split_pct, house_pct, fee_type, fee_amount,
+             effective_from, effective_to, note, now, now),
+        )
+        rule_id = cur.lastrowid
+        conn.execute(
+            """INSERT INTO rule_versions(rule_type, rule_id, version, changed_by, changed_at, change_type, new_value, detail)
+               VALUES (?, ?, 1, ?, ?, ?, ?, ?)""",
+            ("split_rule", str(rule_id), "analyst", now, "created",
+             f"split={split_pct}%/house={house_pct}%", note),
+        )
+    return rule_id
 
 
 def list_split_rules(db_path: Path, producer_id: str | None = None, limit: int = 200) -> list[dict[str, Any]]:
@@ -548,6 +781,21 @@ def create_adjustment(
         return dict(row) if row else {}
 
 
+def create_adjustments(db_path: Path, adjustments: list[dict[str, Any]]) -> int:
+    """Insert many pending adjustments in one transaction."""
+    now = utc_now()
+    with get_conn(db_path) as conn:
+        conn.executemany(
+            """INSERT INTO adjustments(producer_id, adj_type, amount, description, period, status, created_at)
+               VALUES (?, ?, ?, ?, ?, 'pending', ?)""",
+            [
+                (a["producer_id"], a["adj_type"], a["amount"], a.get("description"), a.get("period"), now)
+                for a in adjustments
+            ],
+        )
+    return len(adjustments)
+
+
 def list_adjustments(db_path: Path, producer_id: str | None = None, limit: int = 200) -> list[dict[str, Any]]:
     with get_conn(db_path) as conn:
         if producer_id:
@@ -614,6 +862,21 @@ def log_audit_event(
         return cur.lastrowid or 0
 
 
+def log_audit_events(db_path: Path, events: list[dict[str, Any]]) -> int:
+    """Insert pre-timestamped audit events in one transaction."""
+    with get_conn(db_path) as conn:
+        conn.executemany(
+            """
+            INSERT INTO audit_events(timestamp, event_type, entity_type, entity_id,
+                                     actor, action, detail, old_value, new_value)
+            VALUES (:timestamp, :event_type, :entity_type, :entity_id,
+                    :actor, :action, :detail, :old_value, :new_value)
+            """,
+            events,
+        )
+    return len(events)
+
+
 def list_audit_events(
     db_path: Path,
     entity_type: str | None = None,
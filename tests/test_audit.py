@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import sqlite3
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from app import audit as audit_module
+from app.audit import AuditQueue
+from app.persistence import init_db, list_audit_events, log_audit_events
+
+
+class AuditQueueTests(unittest.TestCase):
+    def test_background_writes_visible_after_flush(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            db = Path(tmp) / "demo.db"
+            init_db(db)
+            audit = AuditQueue()
+            audit.start()
+            try:
+                for i in range(5):
+                    audit.log(db, event_type="export", action="downloaded",
+                              entity_type="export", entity_id=f"file-{i}.csv")
+                audit.flush()
+                rows = list_audit_events(db, entity_type="export")
+                self.assertEqual([r["entity_id"] for r in rows],
+                                 [f"file-{i}.csv" for i in reversed(range(5))])
+            finally:
+                audit.stop()
+
+    def test_writes_synchronously_before_start(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            db = Path(tmp) / "demo.db"
+            init_db(db)
+            AuditQueue().log(db, event_type="gl_posting", action="posted", actor="analyst")
+            rows = list_audit_events(db)
+            self.assertEqual(len(rows), 1)
+            self.assertEqual(rows[0]["actor"], "analyst")
+
+    def test_failed_batch_does_not_stop_the_writer(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            db = Path(tmp) / "demo.db"
+            init_db(db)
+            failures = 2
+
+            def flaky_write(db_path: Path, events: list) -> int:
+                nonlocal failures
+                if failures:
+                    failures -= 1
+                    raise sqlite3.OperationalError("database is locked")
+                return log_audit_events(db_path, events)
+
+            audit = AuditQueue(write_attempts=2, retry_delay=0)
+            audit.start()
+            try:
+                with mock.patch.object(audit_module, "log_audit_events", side_effect=flaky_write), \
+                        self.assertLogs("app.audit", level="ERROR"):
+                    audit.log(db, event_type="export", action="downloaded", entity_id="lost.csv")
+                    audit.flush()
+                    audit.log(db, event_type="export", action="downloaded", entity_id="kept.csv")
+                    audit.flush()
+                self.assertEqual([r["entity_id"] for r in list_audit_events(db)], ["kept.csv"])
+            finally:
+                audit.stop()
+
+    def test_dead_writer_falls_back_to_synchronous_writes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            db = Path(tmp) / "demo.db"
+            init_db(db)
+            audit = AuditQueue()
+            audit._thread = threading.Thread(target=lambda: None)
+            audit._thread.start()
+            audit._thread.join()
+            # Left behind by the writer before it died
+            audit._queue.put((db, {
+                "timestamp": "2026-01-01T00:00:00Z", "event_type": "export", "entity_type": None,
+                "entity_id": "queued.csv", "actor": "system", "action": "downloaded",
+                "detail": None, "old_value": None, "new_value": None,
+            }))
+            audit.log(db, event_type="export", action="downloaded", entity_id="direct.csv")
+            audit.flush()
+            self.assertEqual(sorted(r["entity_id"] for r in list_audit_events(db)), ["direct.csv", "queued.csv"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import csv
+import io
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from fastapi.testclient import TestClient
+
+from app import main
+from app.persistence import ConnectionPool, resolve_exception
+
+
+class ApiTestCase(unittest.TestCase):
+    """Runs the app against a throwaway database; the seed CSVs under data/ are read as-is."""
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.db = Path(tmp.name) / "demo.db"
+        for name, value in (("DB_PATH", self.db), ("db_pool", ConnectionPool(self.db))):
+            patcher = mock.patch.object(main, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.client = TestClient(main.app)
+        self.client.__enter__()
+        self.addCleanup(self.client.__exit__, None, None, None)
+
+
+class ReadCsvTests(unittest.TestCase):
+    def test_memory_mapped_path_parses_like_buffered_reads(self) -> None:
+        content = (
+            'line_id,insured_name,memo\r\n'
+            'L-1,"Smith, Jane","two\r\nlines"\r\n'
+            'L-2,Müller GmbH,"quoted ""word"""\n'
+            'L-3,,\n'
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "lines.csv"
+            path.write_bytes(content.encode("utf-8"))
+            key = main._csv_key(path)
+            buffered = main._read_csv_cached.__wrapped__(*key)
+            with mock.patch.object(main, "CSV_MMAP_MIN_BYTES", 0):
+                mapped = main._read_csv_cached.__wrapped__(*key)
+        self.assertEqual(mapped, buffered)
+        self.assertEqual(len(mapped), 3)
+        self.assertEqual(mapped[0]["memo"], "two\r\nlines")
+
+    def test_memory_mapped_path_on_seed_data(self) -> None:
+        key = main._csv_key(main.STATEMENT_LINES_CSV)
+        with mock.patch.object(main, "CSV_MMAP_MIN_BYTES", 0):
+            mapped = main._read_csv_cached.__wrapped__(*key)
+        self.assertEqual(mapped, main._read_csv_cached.__wrapped__(*key))
+
+
+class ConditionalResponseTests(ApiTestCase):
+    def test_matching_etag_gets_304(self) -> None:
+        first = self.client.get("/api/v1/demo/summary")
+        self.assertEqual(first.status_code, 200)
+        again = self.client.get("/api/v1/demo/summary", headers={"If-None-Match": first.headers["etag"]})
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(again.content, b"")
+
+    def test_if_none_match_lists_and_wildcard(self) -> None:
+        etag = self.client.get("/api/v1/demo/summary").headers["etag"]
+        opaque = etag.removeprefix("W/")
+        for header, status in (
+            (f'"other", {etag}', 304),
+            (f'"other",{opaque}', 304),
+            ("*", 304),
+            (f'{opaque[:-2]}"', 200),
+            ('"other"', 200),
+        ):
+            with self.subTest(header=header):
+                response = self.client.get("/api/v1/demo/summary", headers={"If-None-Match": header})
+                self.assertEqual(response.status_code, status)
+
+    def test_statement_pdf_revalidates_by_etag(self) -> None:
+        url = "/api/v1/demo/statements/STMT-202602-WILSON-01.pdf"
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.headers["cache-control"], main.STATEMENT_PDF_CACHE_CONTROL)
+        again = self.client.get(url, headers={"If-None-Match": f'"x", {first.headers["etag"]}'})
+        self.assertEqual(again.status_code, 304)
+
+    def test_resolving_an_exception_changes_the_etag(self) -> None:
+        self.client.post("/api/v1/demo/match-runs")
+        first = self.client.get("/api/v1/demo/exceptions")
+        etag = first.headers["etag"]
+        line_id = first.json()["rows"][0]["line_id"]
+
+        resolved = self.client.post(
+            "/api/v1/demo/exceptions/resolve",
+            json={"line_id": line_id, "resolution_action": "manual_link"},
+        )
+        self.assertEqual(resolved.status_code, 200)
+        after = self.client.get("/api/v1/demo/exceptions", headers={"If-None-Match": etag})
+        self.assertEqual(after.status_code, 200)
+        self.assertNotEqual(after.headers["etag"], etag)
+        self.assertNotIn(line_id, [r["line_id"] for r in after.json()["rows"]])
+
+    def test_writes_from_outside_the_app_change_the_etag(self) -> None:
+        self.client.post("/api/v1/demo/match-runs")
+        first = self.client.get("/api/v1/demo/exceptions")
+        line_id = first.json()["rows"][0]["line_id"]
+
+        # Another process resolving through persistence directly, bypassing the API
+        self.assertIsNotNone(resolve_exception(self.db, line_id=line_id, resolution_action="manual_link"))
+        after = self.client.get("/api/v1/demo/exceptions", headers={"If-None-Match": first.headers["etag"]})
+        self.assertEqual(after.status_code, 200)
+        self.assertNotIn(line_id, [r["line_id"] for r in after.json()["rows"]])
+        statuses = {r["line_id"]: r["match_status"] for r in self.client.get("/api/v1/demo/accruals").json()["entries"]}
+        self.assertEqual(statuses[line_id], "resolved")
+
+
+def _dict_writer_csv(entries: list[dict]) -> bytes:
+    """CSV as the exports built it before streaming: DictWriter over the whole list."""
+    output = io.StringIO()
+    if entries:
+        writer = csv.DictWriter(output, fieldnames=list(entries[0].keys()))
+        writer.writeheader()
+        for e in entries:
+            writer.writerow(e)
+    return output.getvalue().encode("utf-8")
+
+
+class CsvExportTests(ApiTestCase):
+    EXPORTS = (
+        ("accrual.csv", lambda: main._compute_accruals()["entries"]),
+        ("journal.csv", lambda: main._compute_journal()["entries"]),
+        ("producer-payout.csv", lambda: main._compute_producers()["producers"]),
+    )
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.client.post("/api/v1/demo/match-runs")
+
+    def test_exports_match_unstreamed_output(self) -> None:
+        for filename, entries in self.EXPORTS:
+            with self.subTest(filename=filename):
+                response = self.client.get(f"/api/v1/demo/exports/{filename}")
+                self.assertEqual(response.status_code, 200)
+                self.assertTrue(response.headers["content-type"].startswith("text/csv"))
+                self.assertEqual(response.headers["content-disposition"], f'attachment; filename="{filename}"')
+                self.assertEqual(response.headers["x-accel-buffering"], "no")
+                expected = _dict_writer_csv(list(entries()))
+                self.assertTrue(expected)
+                self.assertEqual(response.content, expected)
+
+    def test_exports_split_across_chunks_match_unstreamed_output(self) -> None:
+        with mock.patch.object(main, "CSV_CHUNK_ROWS", 7):
+            for filename, entries in self.EXPORTS:
+                with self.subTest(filename=filename):
+                    response = self.client.get(f"/api/v1/demo/exports/{filename}")
+                    self.assertEqual(response.content, _dict_writer_csv(list(entries())))
+
+    def test_empty_export_has_no_header(self) -> None:
+        with mock.patch.object(main, "_compute_accruals", return_value={"entries": []}):
+            response = self.client.get("/api/v1/demo/exports/accrual.csv")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b"")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import csv
 import tempfile
 import unittest
 from pathlib import Path
@@ -18,6 +19,19 @@ class MatchingTests(unittest.TestCase):
             totals["auto_matched"] + totals["needs_review"] + totals["unmatched"],
         )
 
+    def test_run_matching_accepts_parsed_rows(self) -> None:
+        def rows(path: str) -> list[dict[str, str]]:
+            with open(path, newline="", encoding="utf-8") as f:
+                return list(csv.DictReader(f))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            from_rows = run_matching(
+                Path(tmp),
+                statements=rows("data/raw/statements/statement_lines.csv"),
+                cash=rows("data/raw/bank/bank_feed.csv"),
+            )
+        self.assertEqual(from_rows, run_matching(Path("data")))
+
     def test_run_matching_handles_missing_files(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             result = run_matching(Path(tmp))
@@ -1,17 +1,26 @@
 from __future__ import annotations
 
+import sqlite3
 import tempfile
 import unittest
 from pathlib import Path
 
 from app.persistence import (
+    ConnectionPool,
+    create_adjustments,
     init_db,
+    list_adjustments,
     list_exceptions,
     list_policy_rules,
+    list_rule_versions,
+    list_split_rules,
     load_policy_overrides,
     resolve_exception,
+    resolve_exceptions,
     save_match_run,
+    select_line_match,
     upsert_policy_rule,
+    upsert_split_rules,
 )
 
 
@@ -58,6 +67,49 @@ class PersistenceTests(unittest.TestCase):
             self.assertEqual(len(resolved_rows), 1)
             self.assertEqual(resolved_rows[0]["line_id"], "L-2")
 
+    def test_select_line_match_joins_exception(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            db = Path(tmp) / "demo.db"
+            init_db(db)
+            save_match_run(
+                db,
+                "run-1",
+                [
+                    {
+                        "line_id": "L-1",
+                        "policy_number": "POL-000001",
+                        "matched_bank_txn_id": "BTX-1",
+                        "confidence": 0.95,
+                        "status": "auto_matched",
+                        "reason": "exact_amount",
+                    },
+                    {
+                        "line_id": "L-2",
+                        "policy_number": "POL-000002",
+                        "matched_bank_txn_id": "BTX-2",
+                        "confidence": 0.72,
+                        "status": "needs_review",
+                        "reason": "near_amount",
+                    },
+                ],
+            )
+
+            pool = ConnectionPool(db)
+            try:
+                with pool.connection() as conn:
+                    match_result, exception = select_line_match(conn, "run-1", "L-1")
+                    self.assertEqual(match_result["status"], "auto_matched")
+                    self.assertIsNone(exception)
+
+                    match_result, exception = select_line_match(conn, "run-1", "L-2")
+                    self.assertEqual(match_result["matched_bank_txn_id"], "BTX-2")
+                    self.assertEqual(exception["status"], "open")
+                    self.assertEqual(exception["suggested_bank_txn_id"], "BTX-2")
+
+                    self.assertEqual(select_line_match(conn, "run-1", "L-9"), (None, None))
+            finally:
+                pool.close()
+
     def test_policy_rule_upsert_and_load(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
             db = Path(tmp) / "demo.db"
@@ -70,6 +122,93 @@ class PersistenceTests(unittest.TestCase):
             overrides = load_policy_overrides(db)
             self.assertEqual(overrides["POL-TYPO-1"], "POL-000009")
 
+    def test_bulk_split_rules_and_adjustments(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            db = Path(tmp) / "demo.db"
+            init_db(db)
+            rules = [
+                {"producer_id": "PRD-001", "split_pct": 70.0, "house_pct": 30.0},
+                {"producer_id": "PRD-001", "split_pct": 60.0, "house_pct": 40.0, "carrier": "Wilson Mutual"},
+                {"producer_id": "PRD-001", "split_pct": 75.0, "house_pct": 25.0},
+            ]
+            self.assertEqual(upsert_split_rules(db, rules), 3)
+            rows = {r["carrier"]: r for r in list_split_rules(db)}
+            self.assertEqual(len(rows), 2)
+            self.assertEqual(rows[None]["split_pct"], 75.0)
+            self.assertEqual(rows[None]["version"], 2)
+            self.assertEqual(len(list_rule_versions(db, rule_type="split_rule")), 3)
+
+            adjustments = [
+                {"producer_id": "PRD-001", "adj_type": "bonus", "amount": 500.0, "period": "2026-01"},
+                {"producer_id": "PRD-002", "adj_type": "chargeback", "amount": -120.5},
+            ]
+            self.assertEqual(create_adjustments(db, adjustments), 2)
+            rows = list_adjustments(db)
+            self.assertEqual(sorted(r["amount"] for r in rows), [-120.5, 500.0])
+            self.assertTrue(all(r["status"] == "pending" for r in rows))
+
+    def test_resolve_exceptions_in_one_batch(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            db = Path(tmp) / "demo.db"
+            init_db(db)
+            results = [
+                {"line_id": f"L-{i}", "policy_number": f"POL-00000{i}", "matched_bank_txn_id": f"BTX-{i}",
+                 "confidence": 0.7, "status": "needs_review", "reason": "near_amount"}
+                for i in (1, 2, 3)
+            ]
+            save_match_run(db, "run-1", results)
+
+            resolved = resolve_exceptions(db, [
+                {"line_id": "L-3", "resolution_action": "auto_resolved"},
+                {"line_id": "L-9", "resolution_action": "auto_resolved"},
+                {"line_id": "L-1", "resolution_action": "auto_resolved", "resolved_bank_txn_id": "BTX-7"},
+            ])
+            self.assertEqual([r["line_id"] for r in resolved], ["L-3", "L-1"])
+            self.assertEqual(resolved[1]["resolved_bank_txn_id"], "BTX-7")
+            self.assertEqual([r["line_id"] for r in list_exceptions(db, status="open")], ["L-2"])
+
+    def test_connection_pool_reuses_connections(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            db = Path(tmp) / "demo.db"
+            init_db(db)
+            pool = ConnectionPool(db, size=2)
+            try:
+                with pool.connection() as conn:
+                    conn.execute("INSERT INTO match_runs(run_id, created_at) VALUES ('run-1', 'now')")
+                    first = conn
+                with pool.connection() as conn:
+                    self.assertIs(conn, first)
+                    row = conn.execute("SELECT run_id FROM match_runs").fetchone()
+                    self.assertEqual(row["run_id"], "run-1")
+                with pool.connection() as a, pool.connection() as b:
+                    self.assertIsNot(a, b)
+            finally:
+                pool.close()
+
+    def test_connection_pool_close_covers_busy_connections(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            db = Path(tmp) / "demo.db"
+            init_db(db)
+            pool = ConnectionPool(db, size=2)
+            with pool.connection() as idle:
+                pass
+            with pool.connection() as busy:
+                pool.close()
+                busy.execute("SELECT 1")
+            for conn in (idle, busy):
+                with self.assertRaises(sqlite3.ProgrammingError):
+                    conn.execute("SELECT 1")
+            with self.assertRaises(RuntimeError):
+                with pool.connection():
+                    pass
+            pool.open()
+            try:
+                with pool.connection() as reopened:
+                    self.assertIsNot(reopened, busy)
+                    reopened.execute("SELECT 1")
+            finally:
+                pool.close()
+
 
 if __name__ == "__main__":
     unittest.main()